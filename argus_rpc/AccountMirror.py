@@ -0,0 +1,178 @@
+import asyncio
+import base58
+from typing import Dict, Iterable, Optional
+
+from .gRPCClient import geyser_pb2, logger
+from .AccountsStream import AccountsStream
+from .RPClient import RPCClient
+from .utils.RPC.compiled_structs import parse_layout
+
+
+class MirroredAccount:
+    """Latest state of a mirrored account. The data is only parsed with the layout the first time it's accessed."""
+    __slots__ = ("pubkey", "data", "slot", "write_version", "lamports", "owner", "layout", "_decoded")
+
+    def __init__(self, pubkey: str, data: bytes, slot: int, write_version: int, lamports: int, owner: str, layout=None):
+        self.pubkey = pubkey
+        self.data = data
+        self.slot = slot
+        self.write_version = write_version  # -1 for state from the RPC snapshot
+        self.lamports = lamports
+        self.owner = owner
+        self.layout = layout
+        self._decoded = None
+
+    @property
+    def decoded_data(self):
+        """Data parsed with the account's layout, None if no layout is registered."""
+        if self._decoded is None and self.layout is not None:
+            self._decoded = parse_layout(self.layout, self.data)
+        return self._decoded
+
+    def is_newer_than(self, other: "MirroredAccount") -> bool:
+        return (self.slot, self.write_version) > (other.slot, other.write_version)
+
+    def __str__(self):
+        return f"Mirrored Account: {self.pubkey}, Slot: {self.slot}"
+
+
+class AccountMirror:
+    """
+    Local copy of a dynamic set of accounts, kept up to date by a Geyser accounts subscription so reads don't need
+    getAccountInfo requests. Initial state comes from a one time getMultipleAccounts snapshot when accounts are added,
+    after that only the stream updates them. Updates are ordered by (slot, write_version) so a late snapshot or
+    a stale update never replaces newer data.
+
+    Example:
+        mirror = AccountMirror(AccountsStream(endpoint, token), rpc_client)
+        asyncio.create_task(mirror.run())
+        await mirror.add(pool_addresses, layout=LAUNCHPAD_POOL_LAYOUT)
+        pool = mirror.get_decoded(pool_address)
+    """
+    def __init__(self, stream: AccountsStream, rpc_client: RPCClient = None, ready_timeout: float = 10):
+        """
+        :param stream: AccountsStream the mirror subscribes with, its account set is managed by the mirror.
+        :param rpc_client: Client for the initial snapshot, without one accounts are empty until their first update.
+        :param ready_timeout: Seconds add() waits for the updated filters to be live before taking the snapshot.
+        """
+        self.stream = stream
+        self.rpc_client = rpc_client
+        self.ready_timeout = ready_timeout
+        self.accounts: Dict[str, MirroredAccount] = {}
+        self.layouts = {}  # Pubkey: layout used to decode it
+        self.subscription_ready = asyncio.Event()
+        self.ready_ping_id = None  # Ping sent after a filter change, subscription_ready is set when its pong arrives
+        self.resync_task = None
+
+    def feed(self, update: geyser_pb2.SubscribeUpdate):
+        """Applies a SubscribeUpdate from the stream, anything other than an update for a mirrored account is ignored."""
+        if update.HasField('pong'):
+            if self.ready_ping_id is not None and update.pong.id == self.ready_ping_id:
+                self.ready_ping_id = None
+                self.subscription_ready.set()
+            return
+        if update.HasField('slot'):
+            if self.ready_ping_id is None:
+                self.subscription_ready.set()  # A new subscription starts with the current filters
+            return
+        if not update.HasField('account'):
+            return
+
+        account = update.account.account
+        pubkey = base58.b58encode(bytes(account.pubkey)).decode()
+        if pubkey not in self.stream.accounts:
+            return  # Removed since the subscription started
+        self._apply(MirroredAccount(
+            pubkey, bytes(account.data), update.account.slot, account.write_version, account.lamports,
+            base58.b58encode(bytes(account.owner)).decode(), self.layouts.get(pubkey)
+        ))
+
+    def _apply(self, mirrored: MirroredAccount):
+        current = self.accounts.get(mirrored.pubkey)
+        if current is None or mirrored.is_newer_than(current):
+            self.accounts[mirrored.pubkey] = mirrored
+
+    async def snapshot(self, pubkeys: Iterable[str]):
+        """Fetches the current state of pubkeys with getMultipleAccounts, kept only where the stream hasn't got newer data."""
+        pubkeys = list(pubkeys)
+        if not pubkeys or self.rpc_client is None:
+            return
+        commitment = "confirmed" if self.stream.COMMITMENT_LEVEL == geyser_pb2.CommitmentLevel.CONFIRMED else "finalized"
+        try:
+            accounts = await self.rpc_client.get_multiple_accounts(pubkeys, commitment=commitment)
+        except RuntimeError as e:
+            logger.warning(f"Snapshot of {len(pubkeys)} mirrored accounts failed, they update from the stream only: {e}")
+            return
+        for pubkey, account in zip(pubkeys, accounts):
+            if account is None or pubkey not in self.stream.accounts:
+                continue
+            self._apply(MirroredAccount(
+                pubkey, account.raw_data(), account.slot or 0, -1, account.lamports, account.owner, self.layouts.get(pubkey)
+            ))
+
+    async def add(self, pubkeys: Iterable[str], layout=None):
+        """
+        Starts mirroring pubkeys. The new filters are pushed onto the live stream, followed by a ping, and the snapshot
+        is taken once its pong arrives (the server has applied the filters by then), so no change in between is missed.
+
+        :param pubkeys: Account addresses to mirror.
+        :param layout: construct.Struct used to decode the accounts' data.
+        """
+        pubkeys = list(pubkeys)
+        if layout is not None:
+            for pubkey in pubkeys:
+                self.layouts[pubkey] = layout
+                if pubkey in self.accounts:
+                    self.accounts[pubkey].layout = layout
+                    self.accounts[pubkey]._decoded = None
+
+        new_pubkeys = [pubkey for pubkey in pubkeys if pubkey not in self.stream.accounts]
+        if not new_pubkeys:
+            return
+        self.subscription_ready.clear()
+        if self.stream.add_accounts(new_pubkeys):
+            self.ready_ping_id = self.stream.send_ping()
+        try:
+            await asyncio.wait_for(self.subscription_ready.wait(), self.ready_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Account subscription not live after {self.ready_timeout} seconds, taking snapshot anyway")
+        await self.snapshot(new_pubkeys)
+
+    def _on_reconnect(self):
+        """Updates may have been missed while disconnected, snapshot everything again once the subscription is live."""
+        self.ready_ping_id = None  # The new subscription's first slot update shows it's live
+        self.subscription_ready.clear()
+        if self.resync_task is None or self.resync_task.done():
+            self.resync_task = asyncio.create_task(self._resync())
+
+    async def _resync(self):
+        try:
+            await asyncio.wait_for(self.subscription_ready.wait(), self.ready_timeout)
+        except asyncio.TimeoutError:
+            return  # Still disconnected, the next reconnect resyncs
+        await self.snapshot(list(self.stream.accounts))
+
+    def remove(self, pubkeys: Iterable[str]):
+        """Stops mirroring pubkeys."""
+        pubkeys = list(pubkeys)
+        for pubkey in pubkeys:
+            self.accounts.pop(pubkey, None)
+            self.layouts.pop(pubkey, None)
+        self.stream.remove_accounts(pubkeys)
+
+    def get(self, pubkey: str) -> Optional[MirroredAccount]:
+        """Latest state of a mirrored account, None if it isn't mirrored or doesn't exist."""
+        return self.accounts.get(pubkey)
+
+    def get_decoded(self, pubkey: str):
+        """Decoded data of a mirrored account, None if it isn't mirrored, doesn't exist or has no layout."""
+        account = self.accounts.get(pubkey)
+        return account.decoded_data if account is not None else None
+
+    async def run(self, reconnect_delay: float = 5):
+        """Keeps the mirror updated until cancelled, reconnecting on errors."""
+        try:
+            await self.stream.run_with_callback(self.feed, reconnect_delay, on_reconnect=self._on_reconnect)
+        finally:
+            if self.resync_task is not None:
+                self.resync_task.cancel()
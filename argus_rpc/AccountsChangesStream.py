@@ -7,71 +7,82 @@ TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
 class AccountsChangesStream(gRPCCLient):
     """AccountsChangesStream which listens for token account changes for given wallet addresses"""
     COMMITMENT_LEVEL = geyser_pb2.CommitmentLevel.CONFIRMED
+    FILTER_PREFIX = "wallet_"  # Named filter of each wallet is FILTER_PREFIX + wallet address
    
-    def __init__(self, endpoint: str, token: str, wallet_addresses: List[str], connection_timeout: int = 30) -> None:
+    def __init__(self, endpoint: str, token: str, wallet_addresses: List[str], connection_timeout: int = 30,
+                 include_slots: bool = False, **kwargs) -> None:
         self.wallet_addresses = wallet_addresses  # List of wallet addresses to monitor
-        super().__init__(endpoint, token, connection_timeout)
+        self.include_slots = include_slots  # Also subscribe to (and yield) slot updates
+        # Raw 32 byte keys of the wallets, matched directly against the owner bytes of each update
+        self.wallet_keys = {base58.b58decode(wallet_address) for wallet_address in wallet_addresses}
+        super().__init__(endpoint, token, connection_timeout, **kwargs)
        
     def valid_response(self, update: geyser_pb2.SubscribeUpdate) -> bool:
         """
         Validate if the update contains a valid token account change.
         """
-        if not (hasattr(update, 'account') and update.account and update.account.account):
-            return False
+        if not update.HasField('account'):
+            return self.include_slots and update.HasField('slot')
         
-        # Parse the token account data to check if it belongs to one of our wallets
-        try:
-            account_data = update.account.account.data
-            if len(account_data) >= 64:  # Token account data should be 165 bytes
-                # The owner is stored at bytes 32-64 in a token account
-                owner_pubkey = base58.b58encode(bytes(account_data[32:64])).decode('utf-8')
-                return owner_pubkey in self.wallet_addresses
-        except Exception as e:
-            print(f"Error parsing account data: {e}")
-            return False
-        
-        return False
+        # The owner is stored at bytes 32-64 in a token account (165 bytes), compare it with the raw wallet keys
+        account_data = update.account.account.data
+        return len(account_data) >= 64 and account_data[32:64] in self.wallet_keys
        
+    def add_accounts(self, wallet_addresses: List[str]) -> bool:
+        """
+        Start monitoring more wallets, the new filters are pushed onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        current = set(self.wallet_addresses)
+        new_addresses = [address for address in dict.fromkeys(wallet_addresses) if address not in current]
+        self.wallet_addresses = list(self.wallet_addresses) + new_addresses
+        self.wallet_keys.update(base58.b58decode(address) for address in new_addresses)
+        return self.update_filters()
+
+    def remove_accounts(self, wallet_addresses: List[str]) -> bool:
+        """
+        Stop monitoring wallets, the new filters are pushed onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        removed = set(wallet_addresses)
+        self.wallet_addresses = [address for address in self.wallet_addresses if address not in removed]
+        self.wallet_keys.difference_update(base58.b58decode(address) for address in removed)
+        return self.update_filters()
+
     def request_iterator(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
         """
         Generate subscription request for monitoring token accounts.
-        Subscribes to all accounts owned by the SPL Token Program, 
-        filtered by wallet owner using memcmp.
+        Each wallet gets its own named filter: accounts owned by the Token Program with the wallet at offset 32 (the
+        token account owner). Filters within one named filter are ANDed by Geyser so they can't be combined, and
+        update.filters shows which wallet an update matched ("wallet_<address>").
        
         Yields:
             geyser_pb2.SubscribeRequest: Configured subscription request
         """
-        try:
-            request = geyser_pb2.SubscribeRequest()
-           
-            # Create the filter for token accounts
-            filter_name = "token_accounts"
-            
-            # Subscribe to all accounts owned by the Token Program
-            request.accounts[filter_name].owner.append(TOKEN_PROGRAM_ID)
-            
-            # Add memcmp filters for each wallet address
-            # This filters for token accounts where the owner field (offset 32) matches our wallet
-            for wallet_address in self.wallet_addresses:
-                # Create memcmp filter
-                memcmp_filter = geyser_pb2.SubscribeRequestFilterAccountsFilterMemcmp()
-                memcmp_filter.offset = 32  # Owner field is at offset 32 in token account
-                memcmp_filter.bytes = base58.b58decode(wallet_address)
-                
-                # Wrap in SubscribeRequestFilterAccountsFilter
-                accounts_filter = geyser_pb2.SubscribeRequestFilterAccountsFilter()
-                accounts_filter.memcmp.CopyFrom(memcmp_filter)
-                
-                # Add to the filters list
-                request.accounts[filter_name].filters.append(accounts_filter)
-           
-            if from_slot is not None and isinstance(from_slot, int):
-                request.from_slot = from_slot
-               
-            request.commitment = self.COMMITMENT_LEVEL
-            
-            yield request
-            
-        except Exception as e:
-            print(f"Error creating request: {e}")
-            raise
\ No newline at end of file
+        request = geyser_pb2.SubscribeRequest()
+
+        for wallet_address in self.wallet_addresses:
+            account_filter = request.accounts[self.FILTER_PREFIX + wallet_address]
+            account_filter.owner.append(TOKEN_PROGRAM_ID)
+
+            memcmp_filter = geyser_pb2.SubscribeRequestFilterAccountsFilterMemcmp()
+            memcmp_filter.offset = 32  # Owner field is at offset 32 in token account
+            memcmp_filter.bytes = base58.b58decode(wallet_address)
+            accounts_filter = geyser_pb2.SubscribeRequestFilterAccountsFilter()
+            accounts_filter.memcmp.CopyFrom(memcmp_filter)
+            account_filter.filters.append(accounts_filter)
+
+        if self.include_slots:
+            slots_entry = request.slots.get_or_create("slots")
+            slots_entry.filter_by_commitment = True
+
+        if from_slot is not None and isinstance(from_slot, int):
+            request.from_slot = from_slot
+
+        request.commitment = self.COMMITMENT_LEVEL
+
+        yield request
@@ -0,0 +1,59 @@
+from .gRPCClient import *
+
+class AccountsStream(gRPCCLient):
+    """AccountsStream which listens for changes to a set of accounts"""
+    COMMITMENT_LEVEL = geyser_pb2.CommitmentLevel.CONFIRMED
+
+    def __init__(self, endpoint: str, token: str, accounts: List[str] = None, connection_timeout: int = 30, **kwargs) -> None:
+        self.accounts = set(accounts or [])  # Account addresses to monitor
+        super().__init__(endpoint, token, connection_timeout, **kwargs)
+
+    def valid_response(self, update: geyser_pb2.SubscribeUpdate) -> bool:
+        """
+        Validate if the update is an account update, a slot update (which shows the subscription is live) or a pong
+        (which shows requests sent before its ping have been handled, see send_ping).
+        """
+        return update.HasField('account') or update.HasField('slot') or update.HasField('pong')
+
+    def add_accounts(self, accounts: List[str]) -> bool:
+        """
+        Start monitoring more accounts, the new filters are pushed onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        self.accounts.update(accounts)
+        return self.update_filters()
+
+    def remove_accounts(self, accounts: List[str]) -> bool:
+        """
+        Stop monitoring accounts, the new filters are pushed onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        self.accounts.difference_update(accounts)
+        return self.update_filters()
+
+    def request_iterator(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
+        """
+        Generate subscription request for monitoring the accounts.
+        Slots are subscribed to as well so the connection isn't considered dead while the accounts are quiet.
+
+        Yields:
+            geyser_pb2.SubscribeRequest: Configured subscription request
+        """
+        request = geyser_pb2.SubscribeRequest()
+
+        # An accounts filter with no accounts matches every account, so leave it out when the set is empty
+        if self.accounts:
+            request.accounts["accounts"].account.extend(sorted(self.accounts))
+
+        slots_entry = request.slots.get_or_create("slots")
+        slots_entry.filter_by_commitment = True
+
+        if from_slot is not None and isinstance(from_slot, int):
+            request.from_slot = from_slot
+
+        request.commitment = self.COMMITMENT_LEVEL
+        yield request
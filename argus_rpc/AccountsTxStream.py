@@ -4,9 +4,9 @@ class AccountsTxStream(gRPCCLient):
     """Enhanced AccountsTxStream with connection monitoring"""
     COMMITMENT_LEVEL = geyser_pb2.CommitmentLevel.CONFIRMED
     
-    def __init__(self, endpoint: str, token: str, accounts: Dict[str, List[str]], connection_timeout: int = 30) -> None:
+    def __init__(self, endpoint: str, token: str, accounts: Dict[str, List[str]], connection_timeout: int = 30, **kwargs) -> None:
         self.accounts = accounts  # Name of account filter: [list of accounts]
-        super().__init__(endpoint, token, connection_timeout)
+        super().__init__(endpoint, token, connection_timeout, **kwargs)
         
     def valid_response(self, update: geyser_pb2.SubscribeUpdate) -> bool:
         """
@@ -23,6 +23,36 @@ class AccountsTxStream(gRPCCLient):
             and len(update.transaction.transaction.meta.err.err) == 0
         )
         
+    def add_accounts(self, filter_name: str, addresses: List[str]) -> bool:
+        """
+        Add addresses to a named filter (created if it doesn't exist) and push the new filters onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        current = self.accounts.get(filter_name, [])
+        self.accounts[filter_name] = list(dict.fromkeys(list(current) + list(addresses)))
+        return self.update_filters()
+
+    def remove_accounts(self, filter_name: str, addresses: List[str] = None) -> bool:
+        """
+        Remove addresses from a named filter, or the whole filter if addresses is None, and push the new filters
+        onto the live stream.
+
+        Returns:
+            True if the live stream was updated, False if there isn't one
+        """
+        if addresses is None:
+            self.accounts.pop(filter_name, None)
+        elif filter_name in self.accounts:
+            removed = set(addresses)
+            remaining = [address for address in self.accounts[filter_name] if address not in removed]
+            if remaining:
+                self.accounts[filter_name] = remaining
+            else:
+                self.accounts.pop(filter_name)  # An empty account_include would match every transaction
+        return self.update_filters()
+
     def request_iterator(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
         """
         Generate subscription request for monitoring the given accounts.
@@ -57,7 +87,7 @@ async def main():
         "add grpc endpoint url here",
         "add grpc token here",
         accounts,
-        ping=True,
+        ping_interval=10,  # Seconds between pings so the stream stays open while quiet
         connection_timeout=30  # Consider connection dead after 30s of no data
     )
 
@@ -4,6 +4,7 @@ import aiohttp
 import time
 import json
 import logging
+from collections import deque
 from .utils.RPC.RPCRequests import RPCRequest, RPC_Error
 
 # Get the current working directory when the script is executed
@@ -28,14 +29,26 @@ rpc_handler.setFormatter(rpc_formatter)
 # Add handler to logger
 rpc_endpoint_logger.addHandler(rpc_handler)
 
+# Priority lanes, highest priority first
+PRIORITY_CRITICAL = "critical"  # e.g. sending transactions
+PRIORITY_INTERACTIVE = "interactive"  # Default, one off requests
+PRIORITY_BULK = "bulk"  # Backfills and other large batches
+PRIORITY_LANES = [PRIORITY_CRITICAL, PRIORITY_INTERACTIVE, PRIORITY_BULK]
+
 class AsyncRPCEndpoint:
-    def __init__(self, url, rps):
+    def __init__(self, url, rps, bulk_min_share=0.1):
         self.url = url
         self.next_rate_limit_reset = time.time() + 1  # Set next credit reset to a second from initialization
         self.last_send_time = time.time() - 5  # At start, do time in the past
         self.rps = rps  # Requests per second
         self.delay_time = 1/rps  # Spread requests over each second
-        self.check_limit_lock = asyncio.Lock()
+        # Requests wait in their lane for a time slot, the dispatcher hands out slots highest priority first
+        # but bulk gets at least bulk_min_share of the slots while it has requests waiting so it's never starved
+        self.lanes = {lane: deque() for lane in PRIORITY_LANES}
+        self.lane_stats = {lane: {"requests": 0, "total_wait": 0.0, "max_wait": 0.0} for lane in PRIORITY_LANES}
+        self.bulk_min_share = bulk_min_share
+        self.slots_since_bulk = 0
+        self.dispatcher_task = None
         self.session = None
         self.request_id = 1
         # Create a child logger specific to this endpoint URL
@@ -61,6 +74,70 @@ class AsyncRPCEndpoint:
 
         return wait_time
 
+    def _next_waiter(self):
+        """Picks the lane to give the next time slot to and pops its oldest waiting request."""
+        for lane in PRIORITY_LANES:
+            while self.lanes[lane] and self.lanes[lane][0].done():  # Drop requests cancelled while waiting
+                self.lanes[lane].popleft()
+
+        bulk_due = self.bulk_min_share > 0 and self.slots_since_bulk + 1 >= 1 / self.bulk_min_share
+        if self.lanes[PRIORITY_BULK] and bulk_due:
+            lane = PRIORITY_BULK
+        else:
+            lane = next((lane for lane in PRIORITY_LANES if self.lanes[lane]), None)
+            if lane is None:
+                return None
+
+        self.slots_since_bulk = 0 if lane == PRIORITY_BULK else self.slots_since_bulk + 1
+        return self.lanes[lane].popleft()
+
+    async def _dispatch_request_slots(self):
+        """Hands out time slots to waiting requests until every lane is empty."""
+        while any(self.lanes.values()):
+            wait_time = self.get_request_time_slot()
+            await asyncio.sleep(wait_time)
+            waiter = self._next_waiter()
+            if waiter is not None:
+                waiter.set_result(None)
+
+    async def acquire_request_slot(self, priority=PRIORITY_INTERACTIVE):
+        """
+        Waits for a time slot to send a request in, keeps the endpoint within its rps.
+
+        :param priority: Lane to wait in, one of PRIORITY_LANES.
+        """
+        if priority not in self.lanes:
+            raise ValueError(f"Unknown priority {priority}, must be one of {PRIORITY_LANES}")
+
+        start_time = time.time()
+        waiter = asyncio.get_running_loop().create_future()
+        self.lanes[priority].append(waiter)
+        if self.dispatcher_task is None or self.dispatcher_task.done():
+            self.dispatcher_task = asyncio.create_task(self._dispatch_request_slots())
+        await waiter
+
+        wait = time.time() - start_time
+        stats = self.lane_stats[priority]
+        stats["requests"] += 1
+        stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def get_lane_stats(self):
+        """
+        Queue wait times per priority lane.
+
+        :return: Dict of lane: {"requests", "queued", "avg_wait", "max_wait"}, waits in seconds.
+        """
+        return {
+            lane: {
+                "requests": stats["requests"],
+                "queued": sum(1 for waiter in self.lanes[lane] if not waiter.done()),
+                "avg_wait": stats["total_wait"] / stats["requests"] if stats["requests"] else 0.0,
+                "max_wait": stats["max_wait"],
+            }
+            for lane, stats in self.lane_stats.items()
+        }
+
     def generate_request_id(self):
         if self.request_id > 1000000:  # Reset every million requests so number doesn't get too large
             self.request_id = 0
@@ -88,16 +165,16 @@ class AsyncRPCEndpoint:
             await asyncio.sleep(backoff_time)
             backoff_time = min(backoff_time * 2, 300)  # Exponential backoff
     
-    async def send_request(self, request: RPCRequest, max_retries=0, timeout=20):
+    async def send_request(self, request: RPCRequest, max_retries=0, timeout=20, priority=None):
         if max_retries < 0:
             self.logger.warning(f"Max retries must be greater than or equal to zero, using no retries instead")
             max_retries = 0
+
+        # Explicit priority, then the request type's own priority, then the default lane
+        priority = priority or request.priority or PRIORITY_INTERACTIVE
         
         for attempt in range(max_retries + 1):  # Plus one as we want to send the initial request, which isn't a 'retry'
-            async with self.check_limit_lock:
-                wait_time = self.get_request_time_slot()
-
-            await asyncio.sleep(wait_time)
+            await self.acquire_request_slot(priority)
             await self.open()  # Make sure session is open
             request_id = self.generate_request_id()
             rpc_json = {"jsonrpc": "2.0", "id": request_id, "method": request.method, "params": request.params}
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import asyncio
+from typing import List, Dict, Any, AsyncGenerator
+
+from .RPClient import RPCClient
+from .AsyncRPCEndpoint import PRIORITY_BULK
+from .utils.RPC.RPCRequests import getSignaturesForAddressRequest
+
+
+class BackfillJob:
+    """
+    Resumable signature backfill of an address. The position of every section (the `before` signature and slot of the
+    last page the caller finished with) is saved to a checkpoint file, so a restarted job carries on from there instead
+    of starting again from the newest signature.
+
+    Delivery is at least once: pages handed out after the last checkpoint save are yielded again when the job is
+    resumed, so the caller should be able to handle repeated signatures. With checkpoint_interval=0 the checkpoint
+    is saved after every page and only the page being processed when the job stopped is repeated.
+
+    Example:
+        job = BackfillJob(rpc_client, address, "backfill.json", until=until_sig, num_of_sections=10)
+        async for signatures in job.run():
+            ...  # Once the loop asks for the next page this one counts as done
+    """
+    def __init__(self, rpc_client: RPCClient, address: str, checkpoint_file: str, before: str = None, until: str = None,
+                 timestamp: int = None, num_of_sections: int = 1, checkpoint_interval: float = 5):
+        """
+        :param rpc_client: RPCClient used to send the requests.
+        :param address: Address of the account to fetch signatures for.
+        :param checkpoint_file: Path of the json file the job's progress is saved to.
+        :param before: Signature to start fetching from, defaults to the newest signature.
+        :param until: Signature to stop at.
+        :param timestamp: Unix timestamp to stop at.
+        :param num_of_sections: How many sections to fetch in parallel, needs both before and until.
+        :param checkpoint_interval: Minimum seconds between checkpoint saves, a save is also done whenever a section finishes.
+                                    0 saves after every page.
+        """
+        self.rpc_client = rpc_client
+        self.address = address
+        self.checkpoint_file = checkpoint_file
+        self.before = before
+        self.until = until
+        self.timestamp = timestamp
+        self.num_of_sections = num_of_sections
+        self.checkpoint_interval = checkpoint_interval
+        self.state = None
+        self.last_save_time = 0
+
+    def load_checkpoint(self) -> bool:
+        """Loads the saved state for this job, returns False if there's no checkpoint for this address."""
+        if not os.path.exists(self.checkpoint_file):
+            return False
+
+        with open(self.checkpoint_file, 'r') as f:
+            state = json.load(f)
+
+        if state.get('address') != self.address:
+            raise ValueError(f"Checkpoint {self.checkpoint_file} is for address {state.get('address')}, not {self.address}")
+
+        self.state = state
+        return True
+
+    def save_checkpoint(self):
+        """Writes the state to a temp file first so a crash mid write can't corrupt the checkpoint."""
+        temp_file = f"{self.checkpoint_file}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(temp_file, self.checkpoint_file)
+        self.last_save_time = time.time()
+
+    async def _plan_sections(self) -> Dict[str, Dict[str, Any]]:
+        """Splits the job into sections, each with its own cursor."""
+        if self.num_of_sections >= 2 and self.before and self.until:
+            signature_slots = await self.rpc_client.get_signature_slots([self.before, self.until])
+            before_slot, until_slot = signature_slots[self.before], signature_slots[self.until]
+            if before_slot is not None and until_slot is not None:
+                sections_sig_bounds = await self.rpc_client.get_signature_sections(
+                    self.before, self.until, before_slot, until_slot, self.num_of_sections
+                )
+                return {
+                    str(section_id): {"before": bounds[1], "before_slot": None, "until": bounds[0], "done": False}
+                    for section_id, bounds in sections_sig_bounds.items()
+                }
+            print(f"Unable to determine slots of before and until, backfilling {self.address} as a single section")
+
+        return {"0": {"before": self.before, "before_slot": None, "until": self.until, "done": False}}
+
+    @property
+    def completed_sections(self) -> List[str]:
+        return [section_id for section_id, section in self.state['sections'].items() if section['done']]
+
+    @property
+    def is_complete(self) -> bool:
+        return self.state is not None and all(section['done'] for section in self.state['sections'].values())
+
+    def _before_timestamp(self, sig) -> bool:
+        """Signatures without a block time are kept, they can't be placed relative to timestamp."""
+        return bool(self.timestamp and sig.block_time is not None and sig.block_time < self.timestamp)
+
+    async def _fetch_section(self, section_id: str, pages: asyncio.Queue):
+        """
+        Pages backwards through one section, putting (section_id, signatures, next cursor, done) on the pages queue.
+        If the section fails the exception is put on the queue in place of the signatures.
+        """
+        section = self.state['sections'][section_id]
+        before = section['before']
+        try:
+            while True:
+                request = getSignaturesForAddressRequest(self.address, before=before, until=section['until'])
+                signatures = await self.rpc_client._send_request_with_failover(request, priority=PRIORITY_BULK)
+                if signatures is None:
+                    raise RuntimeError(f"Unable to fetch signatures for section {section_id} before {before}")
+
+                if not signatures:
+                    await pages.put((section_id, [], None, True))
+                    return
+
+                oldest = signatures[-1]  # Pages are returned newest to oldest
+                done = len(signatures) < 1000 or self._before_timestamp(oldest)
+                valid_sigs = [sig.signature for sig in signatures if sig.err is None and not self._before_timestamp(sig)]
+                await pages.put((section_id, valid_sigs, {"before": oldest.signature, "before_slot": oldest.slot}, done))
+                if done:
+                    return
+                before = oldest.signature
+        except Exception as e:
+            await pages.put((section_id, e, None, True))
+
+    async def run(self) -> AsyncGenerator[List[str], None]:
+        """
+        Runs the job, resuming from the checkpoint file if there is one.
+
+        Yields lists of signatures (one page, excluding error txs) in order from newest to oldest within each section.
+        A page is only recorded once the caller asks for the next one and only saved at the next checkpoint, so pages
+        after the last save are fetched and yielded again on resume, pages before that never are.
+        """
+        if not self.load_checkpoint():
+            self.state = {
+                "address": self.address,
+                "until": self.until,
+                "timestamp": self.timestamp,
+                "sections": await self._plan_sections(),
+            }
+            self.save_checkpoint()
+
+        remaining_sections = [section_id for section_id, section in self.state['sections'].items() if not section['done']]
+        if not remaining_sections:
+            return
+
+        # Bounded so sections can't fetch far ahead of what's been checkpointed
+        pages = asyncio.Queue(maxsize=len(remaining_sections))
+        section_tasks = [asyncio.create_task(self._fetch_section(section_id, pages)) for section_id in remaining_sections]
+
+        try:
+            num_running = len(section_tasks)
+            while num_running:
+                section_id, signatures, cursor, done = await pages.get()
+                if isinstance(signatures, Exception):
+                    # The checkpoint keeps the section's progress up to the failure
+                    raise signatures
+
+                if signatures:
+                    yield signatures
+
+                # The caller has finished with the page so the section's cursor can move past it
+                section = self.state['sections'][section_id]
+                if cursor:
+                    section.update(cursor)
+                if done:
+                    section['done'] = True
+                    num_running -= 1
+
+                if done or time.time() - self.last_save_time >= self.checkpoint_interval:
+                    self.save_checkpoint()
+        finally:
+            for task in section_tasks:
+                if not task.done():
+                    task.cancel()
+            self.save_checkpoint()
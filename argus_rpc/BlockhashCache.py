@@ -0,0 +1,143 @@
+import time
+import asyncio
+import logging
+from typing import Optional
+
+from .gRPCClient import gRPCCLient, geyser_pb2
+from .RPClient import RPCClient
+from .utils.RPC.RPCRequests import getLatestBlockhashRequest, getBlockHeightRequest
+
+logger = logging.getLogger("gRPCClient.BlockhashCache")
+
+
+class CachedBlockhash:
+    def __init__(self, blockhash: str, last_valid_block_height: int, slot: int, source: str):
+        self.blockhash = blockhash
+        self.last_valid_block_height = last_valid_block_height
+        self.slot = slot
+        self.source = source  # "grpc" or "rpc"
+        self.fetched_at = time.time()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def __str__(self):
+        return f"Blockhash: {self.blockhash}, Last valid block height: {self.last_valid_block_height}, Age: {self.age:.2f}s"
+
+
+class BlockhashCache:
+    """
+    Keeps the latest blockhash in memory, refreshed in the background, so building a transaction doesn't need a round
+    trip. Refreshes use the Geyser GetLatestBlockhash unary call and fall back to JSON-RPC getLatestBlockhash.
+    The current block height is refreshed alongside it so blockhashes that have expired are never handed out.
+
+    The gRPC client should be its own instance, start_monitoring closes the channel when a stream ends.
+
+    Example:
+        cache = BlockhashCache(grpc_client=gRPCCLient(endpoint, token), rpc_client=rpc_client)
+        await cache.start()
+        blockhash = cache.get().blockhash
+    """
+    def __init__(self, grpc_client: gRPCCLient = None, rpc_client: RPCClient = None, refresh_interval: float = 1.0,
+                 max_age: float = 10.0, commitment: str = "confirmed", grpc_timeout: float = 2.0):
+        """
+        :param grpc_client: Client for the Geyser unary calls, preferred when given.
+        :param rpc_client: Client for the JSON-RPC fallback.
+        :param refresh_interval: Seconds between refreshes.
+        :param max_age: Default staleness bound, get() returns None for blockhashes older than this.
+        :param commitment: Commitment level of the blockhash ("processed", "confirmed" or "finalized").
+        :param grpc_timeout: Timeout for each gRPC call, kept short so a slow call falls back quickly.
+        """
+        if grpc_client is None and rpc_client is None:
+            raise ValueError("Either grpc_client or rpc_client must be provided.")
+        self.grpc_client = grpc_client
+        self.rpc_client = rpc_client
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.commitment = commitment
+        self.grpc_timeout = grpc_timeout
+        self.latest: Optional[CachedBlockhash] = None
+        self.block_height = None
+        self.refresh_task = None
+
+    async def start(self):
+        """Fetches a first blockhash (so reads work straight away) and starts refreshing in the background."""
+        await self.refresh()
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self.refresh_task and not self.refresh_task.done():
+            self.refresh_task.cancel()
+            try:
+                await self.refresh_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Unexpected error refreshing blockhash: {type(e).__name__} - {e}")
+
+    async def _refresh_from_grpc(self) -> bool:
+        commitment = geyser_pb2.CommitmentLevel.Value(self.commitment.upper())
+        try:
+            # The stub is synchronous so run it off the event loop
+            response = await asyncio.to_thread(self.grpc_client.get_latest_blockhash, commitment, self.grpc_timeout)
+            block_height = await asyncio.to_thread(self.grpc_client.get_block_height, commitment, self.grpc_timeout)
+        except Exception as e:
+            logger.warning(f"gRPC blockhash refresh failed, falling back to JSON-RPC: {e}")
+            return False
+
+        self.latest = CachedBlockhash(response.blockhash, response.last_valid_block_height, response.slot, "grpc")
+        self.block_height = block_height
+        return True
+
+    async def _refresh_from_rpc(self) -> bool:
+        response, block_height = await asyncio.gather(
+            self.rpc_client._send_request(getLatestBlockhashRequest(self.commitment), max_retries=0),
+            self.rpc_client._send_request(getBlockHeightRequest(self.commitment), max_retries=0),
+        )
+        if response is None:
+            logger.warning("JSON-RPC blockhash refresh failed")
+            return False
+
+        self.latest = CachedBlockhash(response.blockhash, response.last_valid_block_height, response.slot, "rpc")
+        if block_height is not None:
+            self.block_height = block_height
+        return True
+
+    async def refresh(self) -> bool:
+        """Fetches a new blockhash now, returns False if every source failed."""
+        if self.grpc_client is not None and await self._refresh_from_grpc():
+            return True
+        if self.rpc_client is not None:
+            return await self._refresh_from_rpc()
+        return False
+
+    @property
+    def blocks_remaining(self) -> Optional[int]:
+        """Blocks left before the cached blockhash expires, None if unknown."""
+        if self.latest is None or self.block_height is None:
+            return None
+        return self.latest.last_valid_block_height - self.block_height
+
+    def get(self, max_age: float = None) -> Optional[CachedBlockhash]:
+        """
+        Latest cached blockhash, served from memory.
+
+        :param max_age: Staleness bound in seconds, defaults to the cache's max_age.
+
+        :return: CachedBlockhash, or None if there isn't one within max_age or it has expired.
+        """
+        if self.latest is None:
+            return None
+        if self.latest.age > (max_age if max_age is not None else self.max_age):
+            return None
+        if self.blocks_remaining is not None and self.blocks_remaining <= 0:
+            return None
+        return self.latest
@@ -0,0 +1,102 @@
+import time
+import asyncio
+from typing import Dict, List
+
+from .RPCRequestManager import RPCRequestManager
+from .utils.RPC.RPCRequests import getSignatureStatusesRequest, getBlockHeightRequest
+
+
+class ConfirmationTracker:
+    """
+    Confirms transactions in the background. Every pending signature is polled together with getSignatureStatuses,
+    up to 256 signatures per request, rather than each caller polling its own.
+
+    Example:
+        status = await tracker.track(signature, commitment="confirmed", last_valid_block_height=height)
+    """
+    MAX_SIGNATURES_PER_REQUEST = 256
+
+    def __init__(self, rpc_client: RPCRequestManager, poll_interval: float = 0.5):
+        """
+        :param rpc_client: Client used to send the status requests.
+        :param poll_interval: Seconds between polls.
+        """
+        self.rpc_client = rpc_client
+        self.poll_interval = poll_interval
+        self.pending: Dict[str, List[dict]] = {}  # Signature: waiters for it
+        self.poll_task = None
+
+    def track(self, signature: str, commitment: str = "confirmed", timeout: float = None,
+              last_valid_block_height: int = None) -> asyncio.Future:
+        """
+        Starts tracking a signature.
+
+        :param signature: Transaction signature.
+        :param commitment: Commitment level to wait for ("processed", "confirmed" or "finalized").
+        :param timeout: Seconds after which to give up.
+        :param last_valid_block_height: Block height after which the transaction's blockhash has expired.
+
+        :return: Future resolving to the RPCSignatureStatus once the transaction reaches commitment (or fails, check
+                 status.err), or to None if it expires first.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending.setdefault(signature, []).append({
+            "future": future,
+            "commitment": commitment,
+            "deadline": time.time() + timeout if timeout is not None else None,
+            "last_valid_block_height": last_valid_block_height,
+        })
+
+        if self.poll_task is None or self.poll_task.done():
+            self.poll_task = asyncio.create_task(self._poll())
+        return future
+
+    @property
+    def num_pending(self) -> int:
+        return len(self.pending)
+
+    async def _poll(self):
+        """Polls every pending signature each interval until none are left."""
+        while self.pending:
+            await asyncio.sleep(self.poll_interval)
+
+            signatures = list(self.pending)
+            chunks = [
+                signatures[i: i + self.MAX_SIGNATURES_PER_REQUEST]
+                for i in range(0, len(signatures), self.MAX_SIGNATURES_PER_REQUEST)
+            ]
+            responses = await asyncio.gather(*[
+                self.rpc_client._send_request(getSignatureStatusesRequest(chunk), max_retries=0) for chunk in chunks
+            ])
+            statuses = {}
+            for response in responses:
+                for status in response or []:
+                    if status is not None:
+                        statuses[status.signature] = status
+
+            block_height = None
+            if any(waiter["last_valid_block_height"] is not None for waiters in self.pending.values() for waiter in waiters):
+                block_height = await self.rpc_client._send_request(getBlockHeightRequest(commitment="confirmed"), max_retries=0)
+
+            now = time.time()
+            for signature in signatures:
+                status = statuses.get(signature)
+                remaining = []
+                for waiter in self.pending.get(signature, []):
+                    future = waiter["future"]
+                    if future.done():  # Caller cancelled
+                        continue
+                    if status is not None and (status.err is not None or status.has_reached(waiter["commitment"])):
+                        future.set_result(status)
+                    elif waiter["deadline"] is not None and now > waiter["deadline"]:
+                        future.set_result(None)
+                    elif (waiter["last_valid_block_height"] is not None and block_height is not None
+                          and block_height > waiter["last_valid_block_height"]):
+                        future.set_result(None)
+                    else:
+                        remaining.append(waiter)
+
+                if remaining:
+                    self.pending[signature] = remaining
+                else:
+                    self.pending.pop(signature, None)
@@ -0,0 +1,136 @@
+import time
+import asyncio
+from typing import Dict, Iterable, Optional
+
+from .RPClient import RPCClient
+
+
+class MintInfo:
+    def __init__(self, mint: str, decimals: int, token_program: str):
+        self.mint = mint
+        self.decimals = decimals
+        self.token_program = token_program  # Owner of the mint, the Token or Token-2022 program
+
+    def __str__(self):
+        return f"Mint: {self.mint}, Decimals: {self.decimals}"
+
+
+class MintInfoCache:
+    """
+    Shared cache of mint decimals. Decimals can't change after a mint is created so entries are kept forever.
+
+    Mints are loaded in bulk with getMultipleAccounts. An account is only taken as a mint if it's owned by the Token
+    or Token-2022 program and has the mint layout (82 bytes, or a Token-2022 mint with extensions), then decimals are
+    read from offset 44. get_decimals() never waits: an unknown mint is queued and resolved in the background
+    together with the other mints queued around the same time, so it can be used inside a stream loop.
+
+    Addresses that aren't mints, or whose load failed, are remembered as misses and not queued again until a retry
+    delay has passed, the delay doubling on each miss up to max_miss_retry_delay.
+
+    Example:
+        mint_cache = MintInfoCache(rpc_client)
+        await mint_cache.load(known_mints)
+        parsed = AccountChangeParser.parse_account_update(update, mint_cache)
+    """
+    TOKEN_PROGRAM_IDS = {"TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"}
+    MINT_SIZE = 82
+    DECIMALS_OFFSET = 44
+    IS_INITIALIZED_OFFSET = 45
+    ACCOUNT_TYPE_OFFSET = 165  # Token-2022 accounts with extensions, padded to the token account size first
+    ACCOUNT_TYPE_MINT = 1
+
+    def __init__(self, rpc_client: RPCClient, batch_delay: float = 0.05, chunk_size: int = 100,
+                 miss_retry_delay: float = 5, max_miss_retry_delay: float = 600):
+        """
+        :param rpc_client: Client used for the getMultipleAccounts requests.
+        :param batch_delay: Seconds queued mints wait for others to join their batch.
+        :param chunk_size: Mints per getMultipleAccounts request.
+        :param miss_retry_delay: Seconds before an address that wasn't a mint (or failed to load) is queued again.
+        :param max_miss_retry_delay: Longest retry delay for an address that keeps missing.
+        """
+        self.rpc_client = rpc_client
+        self.batch_delay = batch_delay
+        self.chunk_size = chunk_size
+        self.miss_retry_delay = miss_retry_delay
+        self.max_miss_retry_delay = max_miss_retry_delay
+        self.mints: Dict[str, MintInfo] = {}
+        self.misses: Dict[str, tuple] = {}  # Address: (time it can be queued again, number of misses)
+        self.queued = set()
+        self.resolve_task = None
+
+    async def load(self, mints: Iterable[str]) -> Dict[str, MintInfo]:
+        """
+        Fetches the mints that aren't cached yet.
+
+        :return: MintInfo for each of mints that exists, keyed by mint address.
+
+        :raises RuntimeError: If some of the mints couldn't be fetched, they're recorded as misses.
+        """
+        mints = list(dict.fromkeys(mints))
+        missing = [mint for mint in mints if mint not in self.mints]
+        if missing:
+            try:
+                accounts = await self.rpc_client.get_multiple_accounts(
+                    missing, commitment="confirmed", chunk_size=self.chunk_size
+                )
+            except RuntimeError:
+                for mint in missing:
+                    self._record_miss(mint)
+                raise
+
+            for mint, account in zip(missing, accounts):
+                if account is None or not self._is_mint(account.owner, account.raw_data()):
+                    self._record_miss(mint)
+                    continue
+                self.misses.pop(mint, None)
+                self.mints[mint] = MintInfo(mint, account.raw_data()[self.DECIMALS_OFFSET], account.owner)
+
+        return {mint: self.mints[mint] for mint in mints if mint in self.mints}
+
+    def _is_mint(self, owner: str, data: bytes) -> bool:
+        """Checks the owner and the layout, token accounts of the same programs also have a byte at offset 44."""
+        if owner not in self.TOKEN_PROGRAM_IDS or len(data) < self.MINT_SIZE:
+            return False
+        if len(data) > self.MINT_SIZE and (
+            len(data) <= self.ACCOUNT_TYPE_OFFSET or data[self.ACCOUNT_TYPE_OFFSET] != self.ACCOUNT_TYPE_MINT
+        ):
+            return False  # Token account, or not a Token-2022 mint with extensions
+        return data[self.IS_INITIALIZED_OFFSET] == 1
+
+    def _record_miss(self, mint: str):
+        _, num_misses = self.misses.get(mint, (0, 0))
+        delay = min(self.max_miss_retry_delay, self.miss_retry_delay * 2 ** num_misses)
+        self.misses[mint] = (time.time() + delay, num_misses + 1)
+
+    def get(self, mint: str) -> Optional[MintInfo]:
+        """
+        Cached MintInfo, or None after queueing the mint to be loaded in the background. A recent miss isn't queued
+        again until its retry delay has passed.
+        """
+        info = self.mints.get(mint)
+        if info is None:
+            miss = self.misses.get(mint)
+            if miss is None or time.time() >= miss[0]:
+                self._queue(mint)
+        return info
+
+    def get_decimals(self, mint: str) -> Optional[int]:
+        info = self.get(mint)
+        return info.decimals if info is not None else None
+
+    def _queue(self, mint: str):
+        self.queued.add(mint)
+        if self.resolve_task is None or self.resolve_task.done():
+            try:
+                self.resolve_task = asyncio.get_running_loop().create_task(self._resolve_queued())
+            except RuntimeError:
+                pass  # No event loop running, the mint stays queued until get() is called from one
+
+    async def _resolve_queued(self):
+        while self.queued:
+            await asyncio.sleep(self.batch_delay)
+            mints, self.queued = list(self.queued), set()
+            try:
+                await self.load(mints)
+            except Exception as e:
+                print(f"Error loading {len(mints)} mints: {e}")
@@ -2,9 +2,9 @@ import os
 import asyncio
 from typing import List, Tuple
 import logging
-from random import choice as random_choice
+from random import choice as random_choice, choices as random_choices
 
-from .AsyncRPCEndpoint import AsyncRPCEndpoint
+from .AsyncRPCEndpoint import AsyncRPCEndpoint, PRIORITY_BULK
 from .utils.RPC.RPCRequests import RPC_Error, RPCRequest
 
 # Get the current working directory when the script is executed
@@ -57,11 +57,19 @@ class RPCRequestManager:
         close_tasks = [endpoint.close() for endpoint in self.endpoints]
         await asyncio.gather(*close_tasks)
 
-    async def _send_request(self, request: RPCRequest, endpoint: AsyncRPCEndpoint = None, max_retries: int=3, timeout: int=30):
+    def get_lane_stats(self):
+        """
+        Queue wait times per priority lane for every endpoint.
+
+        :return: Dict of endpoint url: lane stats (see AsyncRPCEndpoint.get_lane_stats)
+        """
+        return {endpoint.url: endpoint.get_lane_stats() for endpoint in self.endpoints}
+
+    async def _send_request(self, request: RPCRequest, endpoint: AsyncRPCEndpoint = None, max_retries: int=3, timeout: int=30, priority: str=None):
         if endpoint is None:
             endpoint = random_choice(self.endpoints)  # Pick random endpoint to use
         try:
-            return await endpoint.send_request(request, max_retries, timeout)
+            return await endpoint.send_request(request, max_retries, timeout, priority)
         except RPC_Error as e:
             failed_requests_logger.error(f"RPC_Error occurred for endpoint {endpoint.url}: {e}")
         except Exception as e:
@@ -69,11 +77,48 @@ class RPCRequestManager:
         
         return None
     
-    async def _send_request_batch(self, endpoint: AsyncRPCEndpoint, requests: List[RPCRequest], max_retries: int = 3, timeout: int = 30):
-        """Send a batch of requests to a single endpoint asynchronously."""
+    async def _send_request_with_failover(
+        self,
+        request: RPCRequest,
+        max_attempts: int = 3,
+        timeout: int = 30,
+        endpoints: List[AsyncRPCEndpoint] = None,
+        priority: str = None
+    ):
+        """
+        Sends a single request, moving to a different endpoint (picked weighted by rps) after each failed attempt.
+
+        :param request: RPCRequest to send.
+        :param max_attempts: How many endpoints to try before giving up.
+        :param timeout: Timeout for each attempt.
+        :param endpoints: Endpoints to pick from, defaults to all endpoints.
+        :param priority: Priority lane to send in, see AsyncRPCEndpoint.PRIORITY_LANES.
+        :return: Parsed response, or None if every attempt failed.
+        """
+        endpoints = endpoints or self.endpoints
+        failed_endpoints = []
+        for attempt in range(max_attempts):
+            candidates = [endpoint for endpoint in endpoints if endpoint not in failed_endpoints] or endpoints
+            endpoint = random_choices(candidates, weights=[endpoint.rps for endpoint in candidates])[0]
+            response = await self._send_request(request, endpoint, max_retries=0, timeout=timeout, priority=priority)
+            if response is not None:
+                return response
+            failed_endpoints.append(endpoint)
+
+        failed_requests_logger.error(f"Request {request.method} failed after {max_attempts} attempts")
+        return None
+
+    async def _send_request_batch(self, endpoint: AsyncRPCEndpoint, requests: List[RPCRequest], max_retries: int = 3, timeout: int = 30, priority: str = None):
+        """
+        Send a batch of requests to a single endpoint asynchronously. Without an explicit priority each request goes
+        in its own type's lane, or the bulk lane if it has none.
+        """
         
         # Create coroutines for each request
-        request_tasks = [self._send_request(request, endpoint, max_retries, timeout) for request in requests]
+        request_tasks = [
+            self._send_request(request, endpoint, max_retries, timeout, priority or request.priority or PRIORITY_BULK)
+            for request in requests
+        ]
 
         # Run all requests concurrently and wait for them to finish
         responses = await asyncio.gather(*request_tasks, return_exceptions=True)
@@ -90,7 +135,8 @@ class RPCRequestManager:
         requests: List[RPCRequest], 
         max_retries: int = 3, 
         timeout: int = 30, 
-        excluded_endpoints: List[str] = None
+        excluded_endpoints: List[str] = None,
+        priority: str = None
     ):
         """
         Distributes requests across available endpoints and sends them concurrently,
@@ -100,6 +146,9 @@ class RPCRequestManager:
         :param max_retries: Maximum number of retries for each request.
         :param timeout: Timeout for each request.
         :param excluded_endpoints: List of endpoint URLs to exclude from sending requests.
+        :param priority: Priority lane to send every request in. By default each request uses its type's own lane
+                         (e.g. critical for sendTransaction) and the rest go in bulk so large batches don't hold up
+                         other requests.
         :return: Combined results from all endpoints.
         """
         if excluded_endpoints is None:
@@ -128,7 +177,7 @@ class RPCRequestManager:
             if request_group:
                 print(f"Endpoint {endpoint.url} is handling {len(request_group)} requests")
                 # Schedule each batch of requests as a task
-                task = self._send_request_batch(endpoint, request_group, max_retries, timeout)
+                task = self._send_request_batch(endpoint, request_group, max_retries, timeout, priority)
                 endpoint_tasks.append(task)
 
         # Run all endpoint tasks concurrently and gather results
@@ -1,21 +1,34 @@
 from typing import List, Dict, Any, Tuple
+from collections import deque
 import asyncio
+import time
+import base58
 
 from .RPCRequestManager import RPCRequestManager
+from .AsyncRPCEndpoint import PRIORITY_BULK
+from .ConfirmationTracker import ConfirmationTracker
 from .utils.RPC.RPCRequests import *
+from .utils.RPC.filters import create_memcmp_filter
 
 class RPCClient(RPCRequestManager):
-    def __init__(self, endpoints_file: str = None, endpoints_list: List[Tuple[str, int]] = None):
+    MAX_REBROADCAST_SECONDS = 120  # Rebroadcast deadline when the blockhash expiry is unknown, a blockhash lasts 150 blocks (~60-90s)
+
+    def __init__(self, endpoints_file: str = None, endpoints_list: List[Tuple[str, int]] = None, confirmation_poll_interval: float = 0.5):
         """
         Initializes the RPCClient with either a file containing endpoints or a list of (url, rps) tuples.
         
         :param endpoints_file: Path to a file containing endpoint URLs and RPS values.
         :param endpoints_list: List of tuples containing (url, rps) for endpoints.
+        :param confirmation_poll_interval: Seconds between polls of the signatures waiting to be confirmed.
         """
         super().__init__(endpoints_file, endpoints_list)
+        self.confirmation_tracker = ConfirmationTracker(self, confirmation_poll_interval)
+        self.send_ack_latencies = {endpoint.url: deque(maxlen=100) for endpoint in self.endpoints}  # Recent sendTransaction ack times
+        self.rebroadcast_tasks = {}  # Signature: task rebroadcasting it
+        self.broadcast_tasks = set()  # Sends still running after another endpoint acknowledged, kept so they aren't garbage collected
     
 
-    async def get_tx_signatures(self, address, before=None, until=None, timestamp=None, limit=None):
+    async def get_tx_signatures(self, address, before=None, until=None, timestamp=None, limit=None, compact=False):
         """
         Fetches transaction signatures for an address, starting from `before` and stopping at `until` or `timestamp`.
         
@@ -24,16 +37,21 @@ class RPCClient(RPCRequestManager):
         :param until: Transaction signature to stop at.
         :param timestamp: Unix timestamp to stop at. ISSUE: with getblock.io I was getting inconsistent results when using timestamp param
         :param limit: Maximum number of transaction signatures to fetch.
+        :param compact: Return a SignatureList (array backed, signatures are base58 encoded on access) instead of a list,
+        uses far less memory for long histories.
         
         :return: List of transaction signatures that match the conditions, excludes error txs, in order from oldest to newest.
         """
+        if compact:
+            return await self._get_tx_signatures_compact(address, before, until, timestamp, limit)
+
         all_signatures = []
         total_fetched = 0
 
         while True:
             # Prepare the request with the current `end_sig` (fetch older transactions)
             request = getSignaturesForAddressRequest(address, before=before, until=until)
-            signatures = await self._send_request(request)
+            signatures = await self._send_request(request, priority=PRIORITY_BULK)
             # Stop if no signatures are returned, this handles until being hit
             if not signatures or len(signatures) == 0:
                 break
@@ -53,8 +71,8 @@ class RPCClient(RPCRequestManager):
             end_signature = signatures[0]
             before = end_signature.signature
             
-            # If `timestamp` is provided, check if we should stop based on block time
-            if timestamp and end_signature.block_time < timestamp:
+            # If `timestamp` is provided, check if we should stop based on block time (unknown block times never stop it)
+            if timestamp and end_signature.block_time is not None and end_signature.block_time < timestamp:
                 break
 
             if len(signatures) < 1000:  # If get signatures for address returns less than 1000 it means we've reached last page of signatures
@@ -65,7 +83,7 @@ class RPCClient(RPCRequestManager):
         
         # If `timestamp` is provided, filter the signatures again to only return those after the timestamp
         if timestamp:
-            all_signatures = [sig for sig in all_signatures if sig.block_time >= timestamp]
+            all_signatures = [sig for sig in all_signatures if sig.block_time is None or sig.block_time >= timestamp]
         
         if limit:
             all_signatures = all_signatures[:limit]
@@ -73,6 +91,45 @@ class RPCClient(RPCRequestManager):
         print("")  # Progress print uses carriage return so add empty so outside of the fuction prints work
         return [sig.signature for sig in sorted(all_signatures, key=lambda x: x.slot)]
     
+    async def _get_tx_signatures_compact(self, address, before=None, until=None, timestamp=None, limit=None) -> SignatureList:
+        """
+        get_tx_signatures but every page is kept as a SignatureList, pages come back newest to oldest and don't overlap
+        so they're merged without re-sorting.
+        """
+        pages = []
+        num_valid = 0
+        total_fetched = 0
+
+        while True:
+            request = getSignaturesForAddressRequest(address, before=before, until=until, compact=True)
+            signatures = await self._send_request(request, priority=PRIORITY_BULK)
+            if not signatures or len(signatures) == 0:
+                break
+            total_fetched += len(signatures)
+            print(f"Fetched {total_fetched} signatures so far...", end='\r')
+
+            page = signatures.filter(min_time=timestamp, exclude_errors=True, keep_unknown_times=True)
+            pages.append(page)
+            num_valid += len(page)
+
+            before = signatures[0]  # Oldest signature of the page
+
+            if timestamp and 0 <= signatures.block_times[0] < timestamp:  # -1 is an unknown block time
+                break
+
+            if len(signatures) < 1000:  # Last page of signatures
+                break
+
+            if limit and num_valid >= limit:
+                break
+
+        all_signatures = SignatureList.merge(pages[::-1])  # Oldest page first
+        if limit and len(all_signatures) > limit:
+            all_signatures = all_signatures[len(all_signatures) - limit:]  # Keep the newest
+
+        print("")  # Progress print uses carriage return so add empty so outside of the fuction prints work
+        return all_signatures
+
     async def get_tx_signatures_yield(self, address, before=None, until=None, timestamp=None, limit=None, yield_amount=None):
         """
         Fetches transaction signatures for an address, starting from `before` and stopping at `until` or `timestamp`.
@@ -96,7 +153,7 @@ class RPCClient(RPCRequestManager):
         while True:
             # Prepare the request with the current `end_sig` (fetch older transactions)
             request = getSignaturesForAddressRequest(address, before=before, until=until)
-            signatures = await self._send_request(request)
+            signatures = await self._send_request(request, priority=PRIORITY_BULK)
             # Stop if no signatures are returned, this handles until being hit
             if not signatures or len(signatures) == 0:
                 break
@@ -139,82 +196,369 @@ class RPCClient(RPCRequestManager):
         if yield_amount and num_yielded < len(all_signatures):
             yield [sig.signature for sig in all_signatures[num_yielded:]]
     
-    async def get_batched_tx_signatures(self, address, before, until, avg_sigs_per_block=None):
+    async def get_tx_signatures_for_addresses(self, addresses, until=None, timestamp=None, limit=None, num_workers=None,
+                                              max_attempts=3, timeout=30):
+        """
+        Fetches the signatures of many addresses concurrently. Addresses take turns, each turn fetching one page, and an
+        address that needs more pages goes to the back of the queue, so deep histories don't hold up shallow ones.
+        Requests go through the shared endpoints so the whole fetch stays within their rate limits.
+
+        :param addresses: List of addresses to fetch signatures for.
+        :param until: Optional dict of address: signature to stop at for that address.
+        :param timestamp: Unix timestamp to stop at.
+        :param limit: Maximum number of transaction signatures to fetch per address.
+        :param num_workers: Number of requests in flight at once, defaults to the total rps of all endpoints.
+        :param max_attempts: Attempts per request before the address is given up on.
+        :param timeout: Timeout for each request.
+
+        Yields (address, signatures) as soon as each address completes, signatures excludes error txs and is in order from
+        oldest to newest, or is None if fetching that address failed.
+        """
+        addresses = list(dict.fromkeys(addresses))  # Drop duplicates, keeping order
+        if not addresses:
+            return
+        until = until or {}
+        if num_workers is None:
+            num_workers = max(1, sum(endpoint.rps for endpoint in self.endpoints))
+        num_workers = min(num_workers, len(addresses))
+
+        turns = asyncio.Queue()
+        for address in addresses:
+            turns.put_nowait(address)
+        cursors = {address: None for address in addresses}
+        collected = {address: [] for address in addresses}
+        results = asyncio.Queue()
+
+        def before_timestamp(sig):
+            # Signatures without a block time can't be placed, keep them rather than stopping early
+            return timestamp and sig.block_time is not None and sig.block_time < timestamp
+
+        async def fetch_page(address):
+            """Fetches the next page for address, returns True once the address is finished."""
+            request = getSignaturesForAddressRequest(address, before=cursors[address], until=until.get(address))
+            signatures = await self._send_request_with_failover(request, max_attempts, timeout, priority=PRIORITY_BULK)
+            if signatures is None:
+                raise RuntimeError("request failed")
+
+            collected[address].extend(sig for sig in signatures if sig.err is None and not before_timestamp(sig))
+            if (
+                len(signatures) < 1000  # Last page of signatures
+                or (signatures and before_timestamp(signatures[-1]))
+                or (limit and len(collected[address]) >= limit)
+            ):
+                return True
+            cursors[address] = signatures[-1].signature  # Pages are returned newest to oldest
+            return False
+
+        async def worker():
+            while True:
+                address = await turns.get()
+                if address is None:
+                    return
+
+                try:
+                    finished = await fetch_page(address)
+                except Exception as e:
+                    print(f"Unable to fetch signatures for {address}: {e}")
+                    collected.pop(address, None)
+                    await results.put((address, None))
+                    continue
+
+                if finished:
+                    address_sigs = collected.pop(address)[:limit] if limit else collected.pop(address)
+                    await results.put((address, [sig.signature for sig in sorted(address_sigs, key=lambda x: x.slot)]))
+                else:
+                    await turns.put(address)  # Back of the queue
+
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+        try:
+            for _ in range(len(addresses)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def stream_transactions(self, address, before=None, until=None, timestamp=None, limit=None, parser=None,
+                                  max_queued_signatures=5000, num_workers=None, max_attempts=3, timeout=30):
+        """
+        Fetches the transactions of an address as a pipeline: every page from getSignaturesForAddress is fed straight into
+        a pool of getTransaction workers, and optionally a parse stage, so pages and transactions are fetched at the same time.
+        Both stages send through the same endpoints and so share their rate limits, the queue between them is bounded
+        so signatures are never fetched far ahead of transactions.
+
+        :param address: Address of the account to fetch transactions for.
+        :param before: Transaction signature to start fetching from (fetches older transactions).
+        :param until: Transaction signature to stop at.
+        :param timestamp: Unix timestamp to stop at.
+        :param limit: Maximum number of transactions to fetch.
+        :param parser: Optional function applied to each RPCTransaction e.g. extract_pump_fun_transaction,
+        transactions it returns None for are skipped.
+        :param max_queued_signatures: Maximum number of signatures waiting for their transaction to be fetched.
+        :param num_workers: Number of concurrent getTransaction requests, defaults to the total rps of all endpoints.
+        :param max_attempts: Attempts per request before it's given up on.
+        :param timeout: Timeout for each request.
+
+        Yields RPCTransaction objects (or the parser's results) as they're fetched, not in chain order. Excludes error txs.
+
+        :raises RuntimeError: If a page of signatures couldn't be fetched, or after everything else has been yielded
+                              if some transactions still failed after max_attempts (the error lists their signatures).
+        """
+        if num_workers is None:
+            num_workers = max(1, sum(endpoint.rps for endpoint in self.endpoints))
+
+        signature_queue = asyncio.Queue(maxsize=max_queued_signatures)
+        results = asyncio.Queue(maxsize=max_queued_signatures)
+        failed_signatures = []
+
+        def before_timestamp(sig):
+            return timestamp and sig.block_time is not None and sig.block_time < timestamp
+
+        async def queue_signatures():
+            nonlocal before
+            num_queued = 0
+            while True:
+                request = getSignaturesForAddressRequest(address, before=before, until=until)
+                signatures = await self._send_request_with_failover(request, max_attempts, timeout, priority=PRIORITY_BULK)
+                if signatures is None:
+                    raise RuntimeError(f"Unable to fetch signatures for {address} before {before}")
+                if not signatures:
+                    return
+
+                for sig in signatures:
+                    if sig.err is not None or before_timestamp(sig):
+                        continue
+                    await signature_queue.put(sig.signature)
+                    num_queued += 1
+                    if limit and num_queued >= limit:
+                        return
+
+                before = signatures[-1].signature  # Pages are returned newest to oldest
+                if before_timestamp(signatures[-1]):
+                    return
+                if len(signatures) < 1000:  # Last page of signatures
+                    return
+
+        async def fetch_signatures():
+            await queue_signatures()
+            # Only reached when every signature was queued, on errors and cancellation the workers are cancelled instead
+            for _ in range(num_workers):
+                await signature_queue.put(None)  # Tell each worker there's no more signatures
+
+        async def fetch_transactions():
+            while True:
+                signature = await signature_queue.get()
+                if signature is None:
+                    return
+                transaction = await self._send_request_with_failover(getTransactionRequest(signature), max_attempts, timeout, priority=PRIORITY_BULK)
+                if transaction is None:
+                    failed_signatures.append(signature)
+                    continue
+                if parser:
+                    try:
+                        transaction = parser(transaction)
+                    except Exception as e:
+                        print(f"Error parsing {signature}: {e}")
+                        continue
+                    if transaction is None:
+                        continue
+                await results.put(transaction)
+
+        async def run_pipeline():
+            tasks = [asyncio.create_task(fetch_signatures())] + [
+                asyncio.create_task(fetch_transactions()) for _ in range(num_workers)
+            ]
+            error = None
+            try:
+                await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+            finally:
+                for task in tasks:
+                    task.cancel()
+            if error is not None:
+                await results.put(error)
+            await results.put(None)  # Signals the pipeline has finished
+
+        pipeline_task = asyncio.create_task(run_pipeline())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            if not pipeline_task.done():
+                pipeline_task.cancel()
+
+        if failed_signatures:
+            raise RuntimeError(f"Unable to fetch {len(failed_signatures)} transactions: {failed_signatures}")
+
+    async def get_batched_tx_signatures(self, address, before, until, avg_sigs_per_block=None, target_pages_per_section=20,
+                                        num_samples=4, max_sections=100):
         """
         For a given address and start and end signatures, it attempts to split the fetching process into chunks 
         to be processed in parallel.
         
+        The number of sections is planned from the address's signature density, measured by sampling a few slot windows
+        (see estimate_signature_density), so that each section takes around target_pages_per_section pages.
+        Sections that turn out to need more than twice that are split again while they're being fetched.
+        
         :param address: The address of the account we want to fetch signatures for.
         :param before: Start searching backwards in time from this "before" signature.
         :param until: Search until this "until" signature is found.
         :param avg_sigs_per_block: Estimate of average times a tx of the given address is found within 1 block,
-        this is used to determine how many chunks to split it up into (if address isn't frequent -> more chunks is less efficient).
+        if given it's used instead of sampling the density.
+        :param target_pages_per_section: How many pages of 1000 signatures each section should aim for.
+        :param num_samples: How many slot windows to sample when estimating the density.
+        :param max_sections: Maximum number of sections to plan up front.
         
         :return: List of transaction signatures that match the conditions, excludes error txs, in order from oldest to newest.
         """
-        request = getTransactionRequest(before)
-        before_tx = await self._send_request(request)
-        if not before_tx:
+        signature_slots = await self.get_signature_slots([before, until])
+        if signature_slots[before] is None:
             e = f"Unable to determine which slot, before signature: {before} is in."
             print(f"Error occured during batch method, using standard method get_tx_signatures instead, error: {e}")
             return await self.get_tx_signatures(address, before=before, until=until)
 
-        request = getTransactionRequest(until)
-        until_tx = await self._send_request(request)
-        if not until_tx:
+        if signature_slots[until] is None:
             e = f"Unable to determine which slot, until signature: {until} is in."
             print(f"Error occured during batch method, using standard method get_tx_signatures instead, error: {e}")
             return await self.get_tx_signatures(address, before=before, until=until)
 
-        slot_span = before_tx.slot - until_tx.slot
+        before_slot, until_slot = signature_slots[before], signature_slots[until]
+        slot_span = before_slot - until_slot
         if avg_sigs_per_block:
-            estimated_txs_to_fetch = slot_span * avg_sigs_per_block
+            sigs_per_slot = avg_sigs_per_block
         else:
-            estimated_txs_to_fetch = slot_span  # Assume average of 1 tx every block
+            sigs_per_slot = await self.estimate_signature_density(address, until, until_slot, before_slot, num_samples)
+            if sigs_per_slot is None:
+                sigs_per_slot = 1  # Unable to sample, assume average of 1 tx every block
 
-        # Each request gets 1000, so split into 100,000 sections
-        num_of_sections = max(1, estimated_txs_to_fetch // 100000)
+        estimated_txs_to_fetch = int(slot_span * sigs_per_slot)
+        estimated_pages = estimated_txs_to_fetch / 1000  # Each request gets 1000
+        num_of_sections = int(min(max_sections, max(1, estimated_pages // target_pages_per_section)))
 
         if num_of_sections >= 2:
-            try:
-                sections_sig_bounds = await self.get_signature_sections(
-                    before, until, before_tx.slot, until_tx.slot, num_of_sections
-                )
-            except ValueError as e:
-                print(f"Error occured during batch method, using standard method get_tx_signatures instead, error: {e}")
-                return await self.get_tx_signatures(address, before=before, until=until)
-
-
-            # Use a wrapper to include section ID for sorting later
-            async def fetch_with_section_id(section_id, bounds):
+            boundaries = self._resolve_section_boundaries(before, until, before_slot, until_slot, num_of_sections)
+            max_pages = target_pages_per_section * 2
+            section_tasks = set()
+
+            def start_section(section_before, section_until, section_until_slot=None):
+                section_tasks.add(asyncio.ensure_future(self._fetch_section_signatures(
+                    address, section_before, section_until, max_pages, start_section, section_until_slot
+                )))
+
+            # Each section starts fetching as soon as its own two boundaries are known
+            async def fetch_section(section_id):
+                bounds = await self._get_section_bounds(boundaries, section_id)
+                if bounds is None:
+                    return []  # Merged into the next section
                 try:
-                    signatures = await self.get_tx_signatures(address, before=bounds[1], until=bounds[0])
-                    return section_id, signatures
+                    return await self._fetch_section_signatures(address, bounds[1], bounds[0], max_pages, start_section)
                 except Exception as e:
                     raise RuntimeError(f"Error fetching signatures for section {section_id}: {e}")
 
-            # Fetch all sections concurrently
-            print(f"Estimated: {estimated_txs_to_fetch} txs to fetch, splitting into {len(sections_sig_bounds)} sections")
-            request_tasks = [fetch_with_section_id(section_id, bounds) for section_id, bounds in sections_sig_bounds.items()]
-            responses = await asyncio.gather(*request_tasks, return_exceptions=True)
+            # Fetch all sections concurrently, sections that get split add new tasks to section_tasks as they go
+            print(f"Estimated: {estimated_txs_to_fetch} txs to fetch, splitting into {num_of_sections} sections")
+            for section_id in range(num_of_sections):
+                section_tasks.add(asyncio.ensure_future(fetch_section(section_id)))
 
-            # Handle exceptions
-            for response in responses:
-                if isinstance(response, Exception):
-                    print(f"Error occured during batch method, using standard method get_tx_signatures instead, error: {response}")
-                    return await self.get_tx_signatures(address, before=before, until=until)
-
-            # Sort and merge results
             signatures = []
-            for section_id, section_signatures in sorted(responses, key=lambda x: x[0]):
-                signatures.extend(section_signatures)
+            try:
+                while section_tasks:
+                    done, _ = await asyncio.wait(section_tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        section_tasks.discard(task)
+                        signatures.extend(task.result())
+            except Exception as e:
+                # Boundary lookups still running would otherwise keep sending requests in the background
+                for task in list(section_tasks) + boundaries:
+                    if not task.done():
+                        task.cancel()
+                print(f"Error occured during batch method, using standard method get_tx_signatures instead, error: {e}")
+                return await self.get_tx_signatures(address, before=before, until=until)
 
-            return signatures
+            return [sig.signature for sig in sorted(signatures, key=lambda x: x.slot)]
         
         # If there's no point in splitting into sections, use default method
         print(f"Batch method will be inefficient, using standard method get_tx_signatures instead")
         return await self.get_tx_signatures(address, before=before, until=until)
 
+    async def estimate_signature_density(self, address, until, until_slot, before_slot, num_samples=4):
+        """
+        Estimates how many signatures the address has per slot by fetching one page of signatures at a few slots spread
+        evenly between until_slot and before_slot.
+
+        :param address: The address of the account.
+        :param until: Oldest signature of the range, sample pages stop there.
+        :param until_slot: Slot of the until signature.
+        :param before_slot: Newest slot of the range.
+        :param num_samples: How many slot windows to sample.
+
+        :return: Estimated signatures per slot, or None if no window could be sampled.
+        """
+        async def sample_window(sample_slot):
+            sample_sig = await self.get_nearest_sig(sample_slot)
+            if sample_sig is None:
+                return None
+            page = await self._send_request(getSignaturesForAddressRequest(address, before=sample_sig, until=until), priority=PRIORITY_BULK)
+            if page is None:
+                return None
+            if len(page) < 1000:  # Hit until, so the page covers the whole window down to until_slot
+                return len(page), max(1, sample_slot - until_slot)
+            return len(page), max(1, sample_slot - page[-1].slot)
+
+        slot_span = before_slot - until_slot
+        sample_slots = [int(until_slot + slot_span * (i + 0.5) / num_samples) for i in range(num_samples)]
+        samples = await asyncio.gather(*[sample_window(sample_slot) for sample_slot in sample_slots])
+        samples = [sample for sample in samples if sample is not None]
+        if not samples:
+            return None
+
+        # Each sample stands for an equal slice of the range, so average the densities rather than pooling the counts
+        return sum(count / span for count, span in samples) / len(samples)
+
+    async def _fetch_section_signatures(self, address, before, until, max_pages, split_section, until_slot=None, min_split_slots=100):
+        """
+        Pages backwards through one section. Once the section has taken max_pages pages, the rest of it is split in half
+        and the older half is passed to split_section(before, until, until_slot) to be fetched in parallel.
+
+        :return: List of RPCSignature without errors.
+        """
+        valid_sigs = []
+        pages = 0
+        while True:
+            signatures = await self._send_request(getSignaturesForAddressRequest(address, before=before, until=until), priority=PRIORITY_BULK)
+            if signatures is None:
+                raise RuntimeError(f"Unable to fetch signatures before {before}")
+            if not signatures:
+                break
+
+            valid_sigs.extend(sig for sig in signatures if sig.err is None)
+            before = signatures[-1].signature  # Pages are returned newest to oldest
+            oldest_slot = signatures[-1].slot
+
+            if len(signatures) < 1000:  # Reached until
+                break
+
+            pages += 1
+            if pages >= max_pages:
+                if until_slot is None:
+                    until_slot = (await self.get_signature_slots([until]))[until]
+                if until_slot is not None and oldest_slot - until_slot > min_split_slots:
+                    split_slot = (oldest_slot + until_slot) // 2
+                    split_sig = await self.get_nearest_sig(split_slot)
+                    if split_sig is not None:
+                        split_section(split_sig, until, until_slot)
+                        until, until_slot = split_sig, split_slot
+                pages = 0
+
+        return valid_sigs
+
     
     '''async def get_signature_sections(self, sig1, sig2, slot1, slot2, num_of_sections: int):
         """
@@ -258,10 +602,37 @@ class RPCClient(RPCRequestManager):
         
         return sections_sig_bounds'''
     
+    async def get_signature_slots(self, signatures, max_attempts=3, timeout=30):
+        """
+        Looks up which slot each signature landed in using getSignatureStatuses, 256 signatures per request,
+        which is much cheaper than fetching each transaction.
+
+        :param signatures: List of transaction signatures.
+        :param max_attempts: Attempts per request before it's given up on.
+        :param timeout: Timeout for each request.
+
+        :return: Dict of signature: slot, slot is None if the signature couldn't be found.
+        """
+        signatures = list(signatures)
+        chunks = [signatures[i: i + 256] for i in range(0, len(signatures), 256)]
+        requests = [getSignatureStatusesRequest(chunk, search_transaction_history=True) for chunk in chunks]
+        responses = await asyncio.gather(
+            *[self._send_request_with_failover(request, max_attempts, timeout, priority=PRIORITY_BULK) for request in requests]
+        )
+
+        signature_slots = {signature: None for signature in signatures}
+        for response in responses:
+            for status in response or []:
+                if status is not None:
+                    signature_slots[status.signature] = status.slot
+
+        return signature_slots
+
     async def get_signature_sections(self, sig1, sig2, slot1, slot2, num_of_sections: int):
         """
         Given a start and end signature, splits it into num_of_sections where each section has a lower and upper tx sig bounding it.
         If a section cannot be determined due to missing signature bounds, it is merged with the subsequent section.
+        All section boundaries are resolved concurrently.
 
         :param sig1: Starting signature, newest
         :param sig2: Ending signature, oldest
@@ -271,72 +642,349 @@ class RPCClient(RPCRequestManager):
 
         :return: List of RPCSignature pairs, where a pair is the upper and lower bound of the section
         """
+        boundaries = self._resolve_section_boundaries(sig1, sig2, slot1, slot2, num_of_sections)
+        all_bounds = await asyncio.gather(*[self._get_section_bounds(boundaries, index) for index in range(num_of_sections)])
 
-        length = slot1 - slot2
-        section_size = length / num_of_sections
-
-        sections_slot_bounds = []
         sections_sig_bounds = {}
+        for bounds in all_bounds:
+            if bounds is not None:
+                sections_sig_bounds[len(sections_sig_bounds)] = bounds
 
-        for i in range(num_of_sections):
-            start_slot = int(i * section_size + slot2)
-            end_slot = int((i + 1) * section_size + slot2)
-            sections_slot_bounds.append((start_slot, end_slot))
+        # If no valid sections could be formed
+        if not sections_sig_bounds:
+            raise ValueError("Unable to determine valid sections with the given parameters.")
 
-        current_start_sig = sig2
-        current_start_slot = slot2
+        return sections_sig_bounds
 
-        section_num = 0
-        for index, slot_bounds in enumerate(sections_slot_bounds):
-            if index == num_of_sections - 1:
-                # Last section
-                end_sig = sig1
-                end_slot = slot1
-            else:
-                end_slot = slot_bounds[1]
-                end_sig = await self.get_nearest_sig(end_slot)
+    def _resolve_section_boundaries(self, sig1, sig2, slot1, slot2, num_of_sections: int):
+        """
+        Starts resolving the signatures at the boundaries between sections concurrently.
 
-                if end_sig is None:
-                    # Skip this section and merge it with the next
-                    continue
+        :return: List of num_of_sections + 1 tasks from oldest to newest, each resolving to a signature or None if
+                 no signature could be found near that boundary. The first and last are sig2 and sig1.
+        """
+        async def known_sig(sig):
+            return sig
 
-            sections_sig_bounds[section_num] = (current_start_sig, end_sig)
-            current_start_sig = end_sig
-            current_start_slot = end_slot
+        section_size = (slot1 - slot2) / num_of_sections
 
-            section_num += 1  # Increment section num everytime we create valid section
+        boundaries = [asyncio.ensure_future(known_sig(sig2))]
+        for i in range(1, num_of_sections):
+            boundary_slot = int(i * section_size + slot2)
+            boundaries.append(asyncio.ensure_future(self.get_nearest_sig(boundary_slot)))
+        boundaries.append(asyncio.ensure_future(known_sig(sig1)))
 
-        # If no valid sections could be formed
-        if not sections_sig_bounds:
-            raise ValueError("Unable to determine valid sections with the given parameters.")
+        return boundaries
 
-        return sections_sig_bounds
+    async def _get_section_bounds(self, boundaries, index):
+        """
+        Waits for the boundaries of a section, only as many as are needed.
+
+        :param boundaries: Boundary tasks from _resolve_section_boundaries
+        :param index: Index of the section
+
+        :return: (until, before) signature pair for the section, or None if its upper boundary couldn't be found,
+                 in which case the section is covered by the next one.
+        """
+        before = await boundaries[index + 1]
+        if before is None:
+            return None
+
+        # If lower boundaries couldn't be found this section also covers the sections below it
+        for lower_index in range(index, -1, -1):
+            until = await boundaries[lower_index]
+            if until is not None:
+                return until, before
 
-    
     async def get_nearest_sig(self, slot, max_distance=10):
         """
-        Given a slot, it finds the closest valid block and takes a signature from there
+        Given a slot, it finds the closest valid block and takes a signature from there.
+        A single getBlocks call lists the non skipped slots around slot, so only the chosen block is fetched.
         
-        :param tx1: slot we want to find a signature near to
+        :param slot: slot we want to find a signature near to
         :param max_distance: how many slots the sig can be away from slot before stopping and returning none instead
         
         :return: transaction signature
         """
-        i = 0
-        while i < max_distance:
-            request = getBlockRequest(slot + i, transaction_details="signatures")
-            block = await self._send_request(request)
-            if block and len(block.signatures) > 0:
-                return block.signatures[0]
-
-            request = getBlockRequest(slot - i, transaction_details="signatures")
-            block = await self._send_request(request)
+        request = getBlocksRequest(max(0, slot - max_distance), slot + max_distance)
+        confirmed_slots = await self._send_request(request, priority=PRIORITY_BULK)
+        if not confirmed_slots:
+            return None
+
+        # Nearest slots first, prefer the later slot when two are the same distance away
+        for nearest_slot in sorted(confirmed_slots, key=lambda s: (abs(s - slot), -s)):
+            request = getBlockRequest(nearest_slot, transaction_details="signatures")
+            block = await self._send_request(request, priority=PRIORITY_BULK)
             if block and len(block.signatures) > 0:
                 return block.signatures[0]
-            i += 1
         
         return None
-    
+
+    async def get_multiple_accounts(self, pubkeys, encoding="base64", commitment="finalized", data_slice=None,
+                                    chunk_size=100, max_attempts=3, timeout=30):
+        """
+        Fetches many accounts with getMultipleAccounts, split into chunks that are sent in parallel across all endpoints.
+        Each chunk is retried on its own (on a different endpoint) so one failure doesn't restart the whole fetch.
+
+        :param pubkeys: List of account public keys to fetch.
+        :param encoding: Encoding for the account data.
+        :param commitment: Commitment level.
+        :param data_slice: Optional dict with 'offset' and 'length' to only fetch part of each account's data.
+        :param chunk_size: Accounts per getMultipleAccounts request, providers cap this at 100.
+        :param max_attempts: Attempts per chunk before it's given up on.
+        :param timeout: Timeout for each request.
+
+        :return: List of RPCProgramAccount in the same order as pubkeys, None where an account doesn't exist.
+
+        :raises RuntimeError: If any chunk still failed after max_attempts, listing the pubkeys that couldn't be fetched.
+        """
+        pubkeys = list(pubkeys)
+        chunks = [pubkeys[i: i + chunk_size] for i in range(0, len(pubkeys), chunk_size)]
+        requests = [getMultipleAccountsRequest(chunk, encoding=encoding, commitment=commitment, data_slice=data_slice) for chunk in chunks]
+
+        responses = await asyncio.gather(
+            *[self._send_request_with_failover(request, max_attempts, timeout) for request in requests]
+        )
+
+        accounts = []
+        failed_pubkeys = []
+        for chunk, response in zip(chunks, responses):
+            if response is None:
+                failed_pubkeys.extend(chunk)
+            else:
+                accounts.extend(response)
+
+        if failed_pubkeys:
+            raise RuntimeError(f"Unable to fetch {len(failed_pubkeys)} accounts: {failed_pubkeys}")
+        return accounts
+
+    async def get_program_accounts(self, program_id, filters=None, encoding="base64", commitment="finalized",
+                                   two_phase=False, chunk_size=100, max_attempts=3, timeout=30):
+        """
+        Fetches all accounts owned by a program that match the given filters.
+
+        With two_phase=True the scan is split in two so no single request has to carry all the account data:
+        first a getProgramAccounts with a zero length dataSlice lists the matching pubkeys, then the data is
+        fetched with get_multiple_accounts in parallel chunks across all endpoints.
+
+        :param program_id: Program that owns the accounts.
+        :param filters: List of filters, e.g. from filters.create_memcmp_filter / filters.create_datasize_filter.
+        :param encoding: Encoding for the account data.
+        :param commitment: Commitment level.
+        :param two_phase: Use the pubkeys-only pass followed by chunked getMultipleAccounts.
+        :param chunk_size: Accounts per getMultipleAccounts request (two phase only).
+        :param max_attempts: Attempts per request before it's given up on.
+        :param timeout: Timeout for each request.
+
+        :return: List of RPCProgramAccount, or None if the scan failed.
+        """
+        if not two_phase:
+            request = getProgramAccountsRequest(program_id, filters=filters, encoding=encoding, commitment=commitment)
+            return await self._send_request_with_failover(request, max_attempts, timeout)
+
+        # Phase 1: only list the pubkeys, a zero length slice keeps the response small
+        request = getProgramAccountsRequest(
+            program_id, filters=filters, data_slice={"offset": 0, "length": 0}, encoding="base64", commitment=commitment
+        )
+        keyed_accounts = await self._send_request_with_failover(request, max_attempts, timeout)
+        if keyed_accounts is None:
+            return None
+
+        pubkeys = [account.pubkey for account in keyed_accounts]
+        print(f"Found {len(pubkeys)} accounts for program {program_id}, fetching data in chunks of {chunk_size}")
+
+        # Phase 2: fetch the data, accounts closed between the two phases come back as None and are dropped
+        try:
+            accounts = await self.get_multiple_accounts(
+                pubkeys, encoding=encoding, commitment=commitment, chunk_size=chunk_size, max_attempts=max_attempts, timeout=timeout
+            )
+        except RuntimeError as e:
+            print(f"Two phase scan of program {program_id} failed: {e}")
+            return None
+        return [account for account in accounts if account is not None]
+
+    async def get_program_accounts_sharded(self, program_id, shard_offset, filters=None, encoding="base64", commitment="finalized",
+                                           max_prefix_bytes=2, max_concurrent_shards=16, max_attempts=3, timeout=30):
+        """
+        Fetches all accounts owned by a program by splitting the scan into 256 shards, one per value of the byte at
+        shard_offset, each shard being its own getProgramAccounts with an extra memcmp filter. Shards run concurrently
+        across the endpoints and their accounts are yielded as each shard completes.
+        A shard that still fails after max_attempts is split into 256 smaller shards by matching one more byte.
+
+        e.g. shard on the first byte of baseMint: shard_offset=filters.get_offset(LIQUIDITY_STATE_LAYOUT_V4, "baseMint")
+
+        :param program_id: Program that owns the accounts.
+        :param shard_offset: Offset of the field to partition on, should be a field with evenly distributed bytes like a pubkey.
+        :param filters: Extra filters applied to every shard, e.g. a dataSize filter.
+        :param encoding: Encoding for the account data.
+        :param commitment: Commitment level.
+        :param max_prefix_bytes: How many bytes a shard's prefix can grow to when failing shards are split.
+        :param max_concurrent_shards: Maximum number of shard requests in flight at once.
+        :param max_attempts: Attempts per shard before it's split (or given up on).
+        :param timeout: Timeout for each request.
+
+        Yields RPCProgramAccount objects, not in any particular order.
+
+        :raises RuntimeError: After every other shard has been yielded, if some shards still failed at max_prefix_bytes.
+        """
+        results = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max_concurrent_shards)
+        failed_prefixes = []
+
+        async def fetch_shard(prefix):
+            shard_filters = list(filters or []) + [create_memcmp_filter(shard_offset, base58.b58encode(prefix).decode())]
+            request = getProgramAccountsRequest(program_id, filters=shard_filters, encoding=encoding, commitment=commitment)
+            async with semaphore:
+                accounts = await self._send_request_with_failover(request, max_attempts, timeout, priority=PRIORITY_BULK)
+
+            if accounts is not None:
+                await results.put(accounts)
+            elif len(prefix) < max_prefix_bytes:
+                # Split into smaller shards by matching on the next byte as well
+                await asyncio.gather(*[fetch_shard(prefix + bytes([value])) for value in range(256)])
+            else:
+                failed_prefixes.append(prefix)
+
+        async def fetch_all_shards():
+            try:
+                await asyncio.gather(*[fetch_shard(bytes([value])) for value in range(256)])
+            finally:
+                await results.put(None)  # Signals every shard has finished
+
+        shards_task = asyncio.create_task(fetch_all_shards())
+        try:
+            while True:
+                accounts = await results.get()
+                if accounts is None:
+                    break
+                for account in accounts:
+                    yield account
+        finally:
+            if not shards_task.done():
+                shards_task.cancel()
+
+        if failed_prefixes:
+            raise RuntimeError(
+                f"Unable to fetch {len(failed_prefixes)} shards, prefixes: {[prefix.hex() for prefix in failed_prefixes]}"
+            )
+
+    async def send_transaction(self, tx, endpoints: List[str] = None, encoding="base64", skip_preflight=True,
+                               preflight_commitment="confirmed", timeout=10, rebroadcast_interval=None,
+                               last_valid_block_height=None, commitment="confirmed"):
+        """
+        Broadcasts a signed transaction to all (or the given) endpoints at once and returns as soon as the first one
+        acknowledges it. The other sends carry on in the background and every endpoint's ack latency is recorded in
+        send_ack_latencies.
+
+        If rebroadcast_interval is given the transaction keeps being broadcast every rebroadcast_interval seconds in
+        the background until it reaches commitment or the block height passes last_valid_block_height, the task
+        doing this is kept in rebroadcast_tasks under the signature. Without last_valid_block_height the one of the
+        latest blockhash is used (the transaction's blockhash can't outlive it), or if that can't be fetched
+        rebroadcasting stops after MAX_REBROADCAST_SECONDS.
+
+        :param tx: The serialized signed transaction.
+        :param endpoints: URLs of the endpoints to send to, defaults to all.
+        :param encoding: The encoding of tx.
+        :param skip_preflight: If True, skip the preflight transaction checks.
+        :param preflight_commitment: The commitment level for preflight.
+        :param timeout: Timeout for each send.
+        :param rebroadcast_interval: Seconds between rebroadcasts, None to only send once.
+        :param last_valid_block_height: Block height after which the transaction's blockhash has expired.
+        :param commitment: Commitment level at which rebroadcasting stops.
+
+        :return: RPCSendTransactionResponse of the first endpoint to acknowledge, or None if every endpoint failed.
+        """
+        send_endpoints = [endpoint for endpoint in self.endpoints if endpoints is None or endpoint.url in endpoints]
+        if not send_endpoints:
+            raise ValueError("No available endpoints to send transaction to.")
+
+        # Nodes retrying on their own would only duplicate our rebroadcasts
+        max_retries = 0 if rebroadcast_interval else None
+        response = await self._broadcast_transaction(
+            tx, send_endpoints, encoding, skip_preflight, preflight_commitment, timeout, max_retries
+        )
+
+        if response is not None and rebroadcast_interval:
+            self.rebroadcast_tasks[response.signature] = asyncio.create_task(self._rebroadcast_until_landed(
+                tx, response.signature, send_endpoints, encoding, preflight_commitment, timeout, rebroadcast_interval,
+                last_valid_block_height, commitment
+            ))
+
+        return response
+
+    async def _broadcast_transaction(self, tx, endpoints, encoding, skip_preflight, preflight_commitment, timeout, max_retries):
+        """Sends the transaction to every endpoint concurrently, returns the first successful response."""
+        async def send_and_time(endpoint):
+            request = sendTransactionRequest(tx, encoding, skip_preflight, preflight_commitment, max_retries)
+            start_time = time.time()
+            response = await self._send_request(request, endpoint, max_retries=0, timeout=timeout)
+            if response is not None:
+                self.send_ack_latencies.setdefault(endpoint.url, deque(maxlen=100)).append(time.time() - start_time)
+            return response
+
+        send_tasks = [asyncio.ensure_future(send_and_time(endpoint)) for endpoint in endpoints]
+        for task in send_tasks:
+            self.broadcast_tasks.add(task)
+            task.add_done_callback(self.broadcast_tasks.discard)
+        for next_ack in asyncio.as_completed(send_tasks):
+            response = await next_ack
+            if response is not None:
+                return response  # Remaining sends keep going so their latencies are still recorded
+
+        return None
+
+    async def _rebroadcast_until_landed(self, tx, signature, endpoints, encoding, preflight_commitment, timeout, interval,
+                                        last_valid_block_height, commitment):
+        """Rebroadcasts the transaction every interval seconds until it reaches commitment or its blockhash expires."""
+        try:
+            deadline = None
+            if last_valid_block_height is None:
+                latest = await self._send_request_with_failover(getLatestBlockhashRequest(commitment="processed"))
+                if latest is not None:
+                    last_valid_block_height = latest.last_valid_block_height
+                else:
+                    deadline = self.MAX_REBROADCAST_SECONDS
+            landed = self.confirm_transaction(
+                signature, commitment, timeout=deadline, last_valid_block_height=last_valid_block_height
+            )
+            while True:
+                try:
+                    status = await asyncio.wait_for(asyncio.shield(landed), interval)
+                except asyncio.TimeoutError:
+                    await self._broadcast_transaction(tx, endpoints, encoding, True, preflight_commitment, timeout, 0)
+                    continue
+
+                if status is None:
+                    print(f"Blockhash expired before transaction {signature} landed")
+                return status
+        finally:
+            self.rebroadcast_tasks.pop(signature, None)
+
+    def confirm_transaction(self, signature, commitment="confirmed", timeout=None, last_valid_block_height=None) -> asyncio.Future:
+        """
+        Waits for a transaction to be confirmed, the signature is polled in batches with every other pending signature.
+
+        :param signature: Transaction signature.
+        :param commitment: Commitment level to wait for.
+        :param timeout: Seconds after which to give up.
+        :param last_valid_block_height: Block height after which the transaction's blockhash has expired.
+
+        :return: Future resolving to the RPCSignatureStatus once confirmed (or failed, check status.err),
+                 or None if it expired first.
+        """
+        return self.confirmation_tracker.track(signature, commitment, timeout, last_valid_block_height)
+
+    def get_send_latencies(self):
+        """
+        Average sendTransaction ack latency of each endpoint over its recent sends.
+
+        :return: Dict of endpoint url: average latency in seconds, None if it hasn't acknowledged a send yet.
+        """
+        return {
+            url: sum(latencies) / len(latencies) if latencies else None
+            for url, latencies in self.send_ack_latencies.items()
+        }
+
 
 async def example_usage():
     # Example usage
@@ -0,0 +1,102 @@
+import time
+import heapq
+import asyncio
+import itertools
+from typing import AsyncGenerator, List
+
+from .gRPCClient import geyser_pb2, logger
+from .AccountsChangesStream import AccountsChangesStream
+
+
+class ShardedAccountsChangesStream:
+    """
+    AccountsChangesStream for wallet lists too big for one subscription. The wallets are split into shards of at most
+    max_filters_per_subscription (one named filter per wallet), each shard is its own subscription on its own
+    connection, and the updates are merged back into one stream ordered by (slot, write_version).
+
+    Each shard also subscribes to slots. An account update is only released once every shard has reached its slot,
+    so updates from different shards come out in order. A shard that falls behind (e.g. while reconnecting) holds
+    updates back for at most max_delay seconds.
+
+    Example:
+        stream = ShardedAccountsChangesStream(endpoint, token, wallet_addresses, max_filters_per_subscription=100)
+        async for update in stream.start_monitoring():
+            ...
+    """
+    def __init__(self, endpoint: str, token: str, wallet_addresses: List[str], max_filters_per_subscription: int = 100,
+                 connection_timeout: int = 30, max_delay: float = 2.0, **kwargs) -> None:
+        """
+        :param endpoint: gRPC service endpoint URL.
+        :param token: Authentication token for the service.
+        :param wallet_addresses: Wallet addresses to monitor.
+        :param max_filters_per_subscription: Wallets per subscription, set to the account filter limit of the server.
+        :param connection_timeout: Seconds before a shard's connection is considered dead.
+        :param max_delay: Longest an update is held back waiting for slower shards, in seconds.
+        :param kwargs: Channel and ping options passed to each shard's gRPCCLient.
+        """
+        self.wallet_addresses = list(wallet_addresses)
+        self.max_delay = max_delay
+        self.shards = [
+            AccountsChangesStream(endpoint, token, self.wallet_addresses[i: i + max_filters_per_subscription],
+                                  connection_timeout, include_slots=True, **kwargs)
+            for i in range(0, len(self.wallet_addresses), max_filters_per_subscription)
+        ]
+        self.shard_slots = [0] * len(self.shards)  # Latest slot each shard has reached
+        self.pending = []  # Heap of (slot, write_version, sequence, arrival time, update)
+        self.sequence = itertools.count()
+
+    def _on_update(self, shard_index: int, update: geyser_pb2.SubscribeUpdate):
+        if update.HasField('slot'):
+            self.shard_slots[shard_index] = max(self.shard_slots[shard_index], update.slot.slot)
+            return
+        account = update.account
+        self.shard_slots[shard_index] = max(self.shard_slots[shard_index], account.slot)
+        heapq.heappush(
+            self.pending, (account.slot, account.account.write_version, next(self.sequence), time.time(), update)
+        )
+
+    def _release(self) -> List[geyser_pb2.SubscribeUpdate]:
+        """Pops the pending updates every shard has caught up with, or that have waited longer than max_delay."""
+        watermark = min(self.shard_slots)
+        deadline = time.time() - self.max_delay
+        released = []
+        while self.pending and (self.pending[0][0] <= watermark or self.pending[0][3] <= deadline):
+            released.append(heapq.heappop(self.pending)[4])
+        return released
+
+    async def start_monitoring(self, reconnect_delay: float = 5) -> AsyncGenerator[geyser_pb2.SubscribeUpdate, None]:
+        """
+        Runs every shard (reconnecting on errors) and yields the merged account updates.
+        """
+        wake_up = asyncio.Event()
+
+        def on_update(shard_index, update):
+            self._on_update(shard_index, update)
+            wake_up.set()
+
+        tasks = [
+            asyncio.create_task(shard.run_with_callback(
+                lambda update, shard_index=shard_index: on_update(shard_index, update), reconnect_delay
+            ))
+            for shard_index, shard in enumerate(self.shards)
+        ]
+        logger.info(f"Monitoring {len(self.wallet_addresses)} wallets over {len(self.shards)} subscriptions")
+        try:
+            while True:
+                try:
+                    # Time out so updates held back for a lagging shard still go out after max_delay
+                    await asyncio.wait_for(wake_up.wait(), self.max_delay / 2)
+                except asyncio.TimeoutError:
+                    pass
+                wake_up.clear()
+                for update in self._release():
+                    yield update
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.close()
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()
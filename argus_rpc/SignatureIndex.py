@@ -0,0 +1,158 @@
+import json
+import sqlite3
+from typing import List, Optional, Tuple
+
+from .RPClient import RPCClient
+from .AsyncRPCEndpoint import PRIORITY_BULK
+from .utils.RPC.RPCRequests import getSignaturesForAddressRequest
+
+
+class SignatureIndex:
+    """
+    Local on disk (sqlite) index of the signature history of addresses.
+    sync(address) only fetches the signatures newer than the last sync, range queries are then served from the index.
+
+    The sqlite connection is opened on creation, use the index as a context manager or call close() when done.
+
+    Example:
+        with SignatureIndex(rpc_client, "signatures.db") as index:
+            await index.sync(pool_address)
+            signatures = index.get_signatures(pool_address, min_time=start_time, max_time=end_time)
+    """
+    def __init__(self, rpc_client: RPCClient, db_path: str):
+        """
+        :param rpc_client: RPCClient used to fetch new signatures.
+        :param db_path: Path of the sqlite database file, created if it doesn't exist.
+        """
+        self.rpc_client = rpc_client
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS signatures (
+                    address TEXT NOT NULL,
+                    slot INTEGER NOT NULL,
+                    block_time INTEGER,
+                    signature TEXT NOT NULL,
+                    err TEXT,
+                    PRIMARY KEY (address, signature)
+                ) WITHOUT ROWID
+            """)
+            self.connection.execute("CREATE INDEX IF NOT EXISTS signatures_slot ON signatures (address, slot)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS signatures_block_time ON signatures (address, block_time)")
+            # Newest signature of the last completed sync per address, the next sync fetches until it
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    address TEXT PRIMARY KEY,
+                    newest_signature TEXT NOT NULL,
+                    newest_slot INTEGER NOT NULL
+                )
+            """)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_newest_synced(self, address: str) -> Optional[Tuple[str, int]]:
+        """Returns (signature, slot) of the newest signature from the last completed sync, or None if never synced."""
+        row = self.connection.execute(
+            "SELECT newest_signature, newest_slot FROM sync_state WHERE address = ?", (address,)
+        ).fetchone()
+        return row
+
+    async def sync(self, address: str, max_attempts: int = 3, timeout: int = 30) -> int:
+        """
+        Fetches the signatures of address newer than the last sync (using `until`), or its full history on the first sync.
+        Pages are written as they're fetched, if the sync fails the next one fetches the same range again and
+        already stored signatures are ignored.
+
+        :param address: Address to sync.
+        :param max_attempts: Attempts per request before the sync is given up on.
+        :param timeout: Timeout for each request.
+
+        :return: Number of signatures fetched.
+        """
+        newest_synced = self.get_newest_synced(address)
+        until = newest_synced[0] if newest_synced else None
+
+        before = None
+        newest = None
+        num_fetched = 0
+        while True:
+            request = getSignaturesForAddressRequest(address, before=before, until=until)
+            signatures = await self.rpc_client._send_request_with_failover(request, max_attempts, timeout, priority=PRIORITY_BULK)
+            if signatures is None:
+                raise RuntimeError(f"Unable to fetch signatures for {address} before {before}, sync not completed")
+            if not signatures:
+                break
+
+            if newest is None:
+                newest = signatures[0]  # Pages are returned newest to oldest
+
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO signatures (address, slot, block_time, signature, err) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (address, sig.slot, sig.block_time, sig.signature, json.dumps(sig.err) if sig.err is not None else None)
+                        for sig in signatures
+                    ]
+                )
+            num_fetched += len(signatures)
+
+            before = signatures[-1].signature
+            if len(signatures) < 1000:  # Last page of signatures
+                break
+
+        if newest is not None:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (address, newest_signature, newest_slot) VALUES (?, ?, ?)",
+                    (address, newest.signature, newest.slot)
+                )
+
+        return num_fetched
+
+    def get_signatures(self, address: str, min_slot: int = None, max_slot: int = None, min_time: int = None,
+                       max_time: int = None, exclude_errors: bool = True, limit: int = None) -> List[str]:
+        """
+        Range query on the local index, bounds are inclusive.
+
+        :return: List of transaction signatures in order from oldest to newest.
+        """
+        query = "SELECT signature, slot FROM signatures WHERE address = ?"
+        params = [address]
+        if min_slot is not None:
+            query += " AND slot >= ?"
+            params.append(min_slot)
+        if max_slot is not None:
+            query += " AND slot <= ?"
+            params.append(max_slot)
+        if min_time is not None:
+            query += " AND block_time >= ?"
+            params.append(min_time)
+        if max_time is not None:
+            query += " AND block_time <= ?"
+            params.append(max_time)
+        if exclude_errors:
+            query += " AND err IS NULL"
+
+        if limit is not None:
+            # Newest `limit` signatures, still returned oldest to newest
+            query = f"SELECT signature FROM ({query} ORDER BY slot DESC LIMIT ?) ORDER BY slot"
+            params.append(limit)
+        else:
+            query += " ORDER BY slot"
+
+        return [row[0] for row in self.connection.execute(query, params)]
+
+    def count(self, address: str) -> int:
+        """Number of signatures stored for address."""
+        return self.connection.execute("SELECT COUNT(*) FROM signatures WHERE address = ?", (address,)).fetchone()[0]
@@ -0,0 +1,120 @@
+import time
+import heapq
+import asyncio
+import itertools
+from collections import deque
+from typing import Dict, List, Optional
+
+from .gRPCClient import geyser_pb2
+from .SlotStream import SlotStream
+
+
+class SlotClock:
+    """
+    Local clock of the latest processed, confirmed and finalized slots, driven by a Geyser slot subscription instead
+    of polling getSlot. Also estimates the slot duration from when processed slots arrive, and gives futures which
+    resolve once a slot is reached at a commitment level.
+
+    Updates can come from run() (which keeps its own SlotStream subscription) or any other stream that includes slot
+    updates, by passing each update to feed().
+
+    Example:
+        clock = SlotClock(SlotStream(endpoint, token))
+        asyncio.create_task(clock.run())
+        await clock.wait_for_slot(target_slot, commitment="confirmed")
+    """
+    COMMITMENT_NAMES = {
+        geyser_pb2.CommitmentLevel.PROCESSED: "processed",
+        geyser_pb2.CommitmentLevel.CONFIRMED: "confirmed",
+        geyser_pb2.CommitmentLevel.FINALIZED: "finalized",
+    }
+    DEFAULT_SLOT_DURATION = 0.4  # Target slot time, used until enough slots have been seen
+
+    def __init__(self, slot_stream: SlotStream = None, timing_window: int = 150):
+        """
+        :param slot_stream: Stream run() subscribes with, only needed when using run().
+        :param timing_window: Number of recent processed slots the slot duration is estimated over.
+        """
+        self.slot_stream = slot_stream
+        self.slots: Dict[str, Optional[int]] = {name: None for name in self.COMMITMENT_NAMES.values()}
+        self.last_update_time = None
+        self.arrivals = deque(maxlen=timing_window)  # (slot, time it was first processed)
+        self.waiters: Dict[str, List[tuple]] = {name: [] for name in self.COMMITMENT_NAMES.values()}  # Heaps of (slot, id, future)
+        self.waiter_ids = itertools.count()
+
+    def feed(self, update: geyser_pb2.SubscribeUpdate):
+        """Updates the clock from a SubscribeUpdate, anything that isn't a slot update is ignored."""
+        if not update.HasField('slot'):
+            return
+        commitment = self.COMMITMENT_NAMES.get(update.slot.status)
+        if commitment is None:
+            return
+
+        slot = update.slot.slot
+        now = time.time()
+        self.last_update_time = now
+        current = self.slots[commitment]
+        if current is not None and slot <= current:
+            return  # Older slot from a fork or a duplicate
+        self.slots[commitment] = slot
+
+        if commitment == "processed":
+            self.arrivals.append((slot, now))
+
+        waiters = self.waiters[commitment]
+        while waiters and waiters[0][0] <= slot:
+            _, _, future = heapq.heappop(waiters)
+            if not future.done():  # Caller cancelled
+                future.set_result(slot)
+
+    def get_slot(self, commitment: str = "processed") -> Optional[int]:
+        """Latest slot at commitment, None if none has been received yet."""
+        return self.slots[commitment]
+
+    @property
+    def slot_duration(self) -> float:
+        """Estimated seconds per slot over the recent processed slots."""
+        if len(self.arrivals) < 2:
+            return self.DEFAULT_SLOT_DURATION
+        first_slot, first_time = self.arrivals[0]
+        last_slot, last_time = self.arrivals[-1]
+        if last_slot == first_slot:
+            return self.DEFAULT_SLOT_DURATION
+        return (last_time - first_time) / (last_slot - first_slot)
+
+    def estimate_current_slot(self) -> Optional[int]:
+        """Processed slot extrapolated to now, accounts for time since the last update."""
+        if not self.arrivals:
+            return self.slots["processed"]
+        last_slot, last_time = self.arrivals[-1]
+        return last_slot + int((time.time() - last_time) / self.slot_duration)
+
+    def estimate_slot_time(self, slot: int) -> Optional[float]:
+        """Estimated unix time at which slot is (or was) processed."""
+        if not self.arrivals:
+            return None
+        last_slot, last_time = self.arrivals[-1]
+        return last_time + (slot - last_slot) * self.slot_duration
+
+    def wait_for_slot(self, slot: int, commitment: str = "processed") -> asyncio.Future:
+        """
+        Future which resolves once slot has been reached at commitment.
+
+        :param slot: Slot to wait for.
+        :param commitment: Commitment level ("processed", "confirmed" or "finalized").
+
+        :return: Future resolving to the slot at commitment when it reached slot. Use asyncio.wait_for for a timeout.
+        """
+        future = asyncio.get_running_loop().create_future()
+        current = self.slots[commitment]
+        if current is not None and current >= slot:
+            future.set_result(current)
+        else:
+            heapq.heappush(self.waiters[commitment], (slot, next(self.waiter_ids), future))
+        return future
+
+    async def run(self, reconnect_delay: float = 5):
+        """Keeps the clock updated from slot_stream until cancelled, reconnecting on errors."""
+        if self.slot_stream is None:
+            raise ValueError("slot_stream is required to run the slot clock")
+        await self.slot_stream.run_with_callback(self.feed, reconnect_delay)
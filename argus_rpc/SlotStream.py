@@ -0,0 +1,31 @@
+from .gRPCClient import *
+
+class SlotStream(gRPCCLient):
+    """SlotStream which listens for slot updates at every commitment level"""
+    COMMITMENT_LEVEL = geyser_pb2.CommitmentLevel.PROCESSED
+
+    def valid_response(self, update: geyser_pb2.SubscribeUpdate) -> bool:
+        """
+        Validate if the update is a slot update.
+        """
+        return update.HasField('slot')
+
+    def request_iterator(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
+        """
+        Generate subscription request for slot updates.
+        filter_by_commitment is off so each slot is received once per commitment level (processed, confirmed and
+        finalized) rather than only at the request commitment.
+
+        Yields:
+            geyser_pb2.SubscribeRequest: Configured subscription request
+        """
+        request = geyser_pb2.SubscribeRequest()
+
+        slots_entry = request.slots.get_or_create("slots")
+        slots_entry.filter_by_commitment = False
+
+        if from_slot is not None and isinstance(from_slot, int):
+            request.from_slot = from_slot
+
+        request.commitment = self.COMMITMENT_LEVEL
+        yield request
@@ -0,0 +1,186 @@
+import sqlite3
+from typing import Optional, Tuple
+
+from .RPClient import RPCClient
+from .SlotClock import SlotClock
+from .utils.RPC.RPCRequests import getBlocksWithLimitRequest, getBlockTimeRequest, getSlotRequest
+
+
+class SlotTimeResolver:
+    """
+    Finds which slot corresponds to a unix timestamp by searching getBlockTime lookups through the rate limited client.
+    Every (slot, block_time) pair that gets probed is saved to a local sqlite index and used to bound later searches,
+    so repeated lookups take one or two RPC calls, or none once the index is dense enough around a time.
+
+    The sqlite connection is opened on creation, use the resolver as a context manager or call close() when done.
+
+    Example:
+        with SlotTimeResolver(rpc_client, "block_times.db") as resolver:
+            start_slot = await resolver.get_slot_at(start_timestamp)
+    """
+    SECONDS_PER_SLOT = 0.4  # Target slot time, only used for the first guess when the index is empty
+
+    def __init__(self, rpc_client: RPCClient, db_path: str, slot_clock: SlotClock = None):
+        """
+        :param rpc_client: RPCClient used to send the requests.
+        :param db_path: Path of the sqlite database file, created if it doesn't exist.
+        :param slot_clock: Running SlotClock, used for the current slot instead of a getSlot request when given.
+        """
+        self.rpc_client = rpc_client
+        self.slot_clock = slot_clock
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        with self.connection:
+            # skipped_from: no confirmed blocks between skipped_from and slot (exclusive), so the block before slot is
+            # at skipped_from - 1 or earlier
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS block_times (
+                    slot INTEGER PRIMARY KEY,
+                    block_time INTEGER NOT NULL,
+                    skipped_from INTEGER NOT NULL
+                )
+            """)
+            self.connection.execute("CREATE INDEX IF NOT EXISTS block_times_time ON block_times (block_time)")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _store(self, slot: int, block_time: int, skipped_from: int):
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO block_times (slot, block_time, skipped_from) VALUES (?, ?, ?) "
+                "ON CONFLICT(slot) DO UPDATE SET skipped_from = MIN(skipped_from, excluded.skipped_from)",
+                (slot, block_time, skipped_from)
+            )
+
+    def _known_bounds(self, timestamp: int) -> Tuple[Optional[tuple], Optional[tuple]]:
+        """Closest indexed blocks before and at/after timestamp, as (slot, block_time, skipped_from)."""
+        lower = self.connection.execute(
+            "SELECT slot, block_time, skipped_from FROM block_times WHERE block_time < ? ORDER BY slot DESC LIMIT 1",
+            (timestamp,)
+        ).fetchone()
+        upper = self.connection.execute(
+            "SELECT slot, block_time, skipped_from FROM block_times WHERE block_time >= ? ORDER BY slot ASC LIMIT 1",
+            (timestamp,)
+        ).fetchone()
+        return lower, upper
+
+    async def _probe(self, slot: int) -> Optional[Tuple[int, int]]:
+        """
+        Finds the first confirmed block at or after slot and its block time, stores it in the index.
+
+        :return: (confirmed slot, block_time), or None if it couldn't be fetched.
+        """
+        confirmed_slots = await self.rpc_client._send_request_with_failover(getBlocksWithLimitRequest(slot, 1))
+        if not confirmed_slots:
+            return None
+        confirmed_slot = confirmed_slots[0]
+
+        block_time = await self.rpc_client._send_request_with_failover(getBlockTimeRequest(confirmed_slot))
+        if block_time is None:
+            return None
+
+        self._store(confirmed_slot, block_time, slot)
+        return confirmed_slot, block_time
+
+    async def get_block_time(self, slot: int) -> Optional[int]:
+        """Block time of a confirmed slot, served from the index if it's been seen before."""
+        row = self.connection.execute("SELECT block_time FROM block_times WHERE slot = ?", (slot,)).fetchone()
+        if row:
+            return row[0]
+        block_time = await self.rpc_client._send_request_with_failover(getBlockTimeRequest(slot))
+        if block_time is not None:
+            self._store(slot, block_time, slot)
+        return block_time
+
+    async def _initial_bounds(self, timestamp: int, lower, upper):
+        """Fills in whichever bound the index doesn't have yet."""
+        if upper is None:
+            current_slot = self.slot_clock.get_slot("finalized") if self.slot_clock else None
+            if current_slot is None:
+                current_slot = await self.rpc_client._send_request_with_failover(getSlotRequest())
+            if current_slot is None:
+                raise RuntimeError("Unable to get current slot")
+            probe = await self._probe(max(0, current_slot - 64))  # A little behind the tip so it's finalized
+            if probe is None:
+                raise RuntimeError("Unable to get block time of current slot")
+            if probe[1] < timestamp:
+                return None, None  # Timestamp is in the future
+            upper = (probe[0], probe[1], probe[0])
+
+        step = None
+        while lower is None:
+            if step is None:
+                step = int((upper[1] - timestamp) / self.SECONDS_PER_SLOT) + 1000
+            guess = max(0, upper[0] - step)
+            probe = await self._probe(guess)
+            if probe is None:
+                raise RuntimeError(f"Unable to probe block time near slot {guess}")
+            if probe[1] < timestamp:
+                lower = (probe[0], probe[1], guess)
+            else:
+                if probe[0] < upper[0]:
+                    upper = (probe[0], probe[1], guess)
+                if guess == 0:
+                    return None, upper  # Timestamp is before the first block
+                step *= 2
+
+        return lower, upper
+
+    async def get_slot_at(self, timestamp: int) -> Optional[int]:
+        """
+        Finds the first confirmed slot with a block time at or after timestamp.
+
+        Interpolates between the closest known blocks either side of timestamp, falling back to bisection when
+        interpolation isn't shrinking the range fast enough.
+
+        :param timestamp: Unix timestamp.
+
+        :return: Slot, or None if timestamp is after the latest block.
+        """
+        lower, upper = self._known_bounds(timestamp)
+        if lower is None or upper is None:
+            lower, upper = await self._initial_bounds(timestamp, lower, upper)
+            if upper is None:
+                return None
+            if lower is None:
+                return upper[0]
+
+        lower_slot, lower_time = lower[0], lower[1]
+        upper_slot, upper_time = upper[0], upper[1]
+        # Slots from search_end up to upper_slot are known to be skipped, so there's nothing left to search there
+        search_end = upper[2]
+        use_bisection = False
+
+        while search_end - lower_slot > 1:
+            if use_bisection or upper_time == lower_time:
+                guess = (lower_slot + search_end) // 2
+            else:
+                guess = lower_slot + int((timestamp - lower_time) * (upper_slot - lower_slot) / (upper_time - lower_time))
+            guess = min(max(guess, lower_slot + 1), search_end - 1)
+
+            range_size = search_end - lower_slot
+            probe = await self._probe(guess)
+            if probe is None:
+                raise RuntimeError(f"Unable to probe block time near slot {guess}")
+            confirmed_slot, block_time = probe
+
+            if confirmed_slot >= upper_slot:
+                search_end = guess  # No confirmed blocks from guess up to upper_slot
+            elif block_time >= timestamp:
+                upper_slot, upper_time, search_end = confirmed_slot, block_time, guess
+            else:
+                lower_slot, lower_time = confirmed_slot, block_time
+
+            # Bisect next time if interpolation didn't at least halve the range
+            use_bisection = (search_end - lower_slot) * 2 > range_size
+
+        # Nothing confirmed between lower_slot and upper_slot, remember that so the answer is in the index next time
+        self._store(upper_slot, upper_time, lower_slot + 1)
+        return upper_slot
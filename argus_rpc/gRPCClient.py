@@ -3,10 +3,13 @@ Client class for interacting with the Solana Yellowstone gRPC.
 """
 
 import os
+import queue
 import asyncio
+import threading
 import grpc
 import logging
 import time
+import itertools
 from typing import Iterator, AsyncGenerator, Dict, List
 
 from .generated import geyser_pb2
@@ -70,18 +73,38 @@ class gRPCCLient:
         stub (geyser_pb2_grpc.GeyserStub): gRPC stub for communication
         connection_timeout (int): Timeout for considering connection dead
     """
-    def __init__(self, endpoint: str, token: str, connection_timeout: int = 60) -> None:
+    def __init__(self, endpoint: str, token: str, connection_timeout: int = 60, ping_interval: float = 10,
+                 keepalive_time_ms: int = 30000, keepalive_timeout_ms: int = 10000,
+                 max_receive_message_length: int = 64 * 1024 * 1024, initial_window_size: int = None,
+                 gzip: bool = False) -> None:
         """
         Args:
             endpoint: gRPC service endpoint URL (your RPC endpoint with port 10000)
             token: Authentication token for the service
             connection_timeout: Seconds before considering connection dead
+            ping_interval: Seconds between ping requests sent on the subscription (None to not send any), the pongs
+                           keep quiet streams from hitting connection_timeout or being closed by proxies
+            keepalive_time_ms: Interval of HTTP/2 keepalive pings
+            keepalive_timeout_ms: How long to wait for a keepalive ack before the connection is considered dead
+            max_receive_message_length: Largest message accepted, full blocks can be well over the 4MB gRPC default
+            initial_window_size: Fixed HTTP/2 stream window in bytes, None leaves gRPC to size it from the
+                                 measured bandwidth delay product
+            gzip: Compress with gzip
         """
         self.endpoint = endpoint.replace('http://', '').replace('https://', '')
         self.token = token
         self.connection_timeout = connection_timeout
+        self.ping_interval = ping_interval
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.max_receive_message_length = max_receive_message_length
+        self.initial_window_size = initial_window_size
+        self.gzip = gzip
+        self.ping_ids = itertools.count(1)
         self.channel = None
         self.stub = None
+        self.call = None  # Active Subscribe call when run with run_with_callback
+        self.request_queue = None  # Requests sent on the live stream after the initial one, see update_filters
         self._connect()
 
     def _connect(self):
@@ -96,6 +119,20 @@ class gRPCCLient:
         self.stub = geyser_pb2_grpc.GeyserStub(self.channel)
         logger.info(f"Connected to gRPC endpoint: {self.endpoint}")
 
+    def _channel_options(self) -> List[tuple]:
+        """gRPC channel arguments for long lived streams."""
+        options = [
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),  # Keepalive pings even when no data is being sent
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+        ]
+        if self.initial_window_size is not None:
+            options.append(("grpc.http2.lookahead_bytes", self.initial_window_size))
+            options.append(("grpc.http2.bdp_probe", 0))  # Otherwise the window is resized dynamically
+        return options
+
     def _create_secure_channel(self) -> grpc.Channel:
         """Create a secure gRPC channel with authentication credentials and options."""
         auth = grpc.metadata_call_credentials(
@@ -104,7 +141,12 @@ class gRPCCLient:
         ssl_creds = grpc.ssl_channel_credentials()
         combined_creds = grpc.composite_channel_credentials(ssl_creds, auth)
         
-        return grpc.secure_channel(self.endpoint, credentials=combined_creds)
+        return grpc.secure_channel(
+            self.endpoint,
+            credentials=combined_creds,
+            options=self._channel_options(),
+            compression=grpc.Compression.Gzip if self.gzip else None,
+        )
 
     def request_iterator(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
         """
@@ -124,6 +166,74 @@ class gRPCCLient:
         
         yield request
     
+    def _request_stream(self, from_slot=None) -> Iterator[geyser_pb2.SubscribeRequest]:
+        """
+        Requests sent on a Subscribe call: those of request_iterator, then any pushed onto request_queue while the
+        stream is live, with a ping every ping_interval. Ends when close_request_stream is called.
+        """
+        request_queue = self.request_queue = queue.Queue()
+
+        def requests():
+            yield from self.request_iterator(from_slot)
+            while True:
+                try:
+                    request = request_queue.get(timeout=self.ping_interval)
+                except queue.Empty:
+                    request = self._ping_request()
+                if request is None:
+                    return
+                yield request
+
+        return requests()
+
+    def _ping_request(self) -> geyser_pb2.SubscribeRequest:
+        """Ping request, answered with a pong update. Geyser doesn't treat it as a change of filters."""
+        return geyser_pb2.SubscribeRequest(ping=geyser_pb2.SubscribeRequestPing(id=next(self.ping_ids)))
+
+    def _handle_ping(self, response: geyser_pb2.SubscribeUpdate):
+        """Replies to a server ping, some load balancers close streams where the client never sends anything."""
+        if response.HasField('ping'):
+            request_queue = self.request_queue
+            if request_queue is not None:
+                request_queue.put(self._ping_request())
+
+    def send_ping(self):
+        """
+        Sends a ping on the live stream. Requests are sent in order, so once its pong arrives the server has handled
+        every request sent before it (e.g. the new filters from update_filters).
+
+        Returns:
+            Id the pong update will carry, or None if there is no live stream
+        """
+        request_queue = self.request_queue
+        if request_queue is None:
+            return None
+        request = self._ping_request()
+        request_queue.put(request)
+        return request.ping.id
+
+    def close_request_stream(self):
+        """Ends the request stream of the current subscription, which stops the thread gRPC reads it on."""
+        if self.request_queue is not None:
+            self.request_queue.put(None)
+            self.request_queue = None
+
+    def update_filters(self) -> bool:
+        """
+        Sends a new request from request_iterator (the current filters) on the live stream. Geyser replaces the
+        subscription's filters with it, so the change takes effect within a round trip without reconnecting.
+        Call it after changing what the stream watches.
+
+        Returns:
+            True if sent on a live stream, False if there isn't one (the next subscription uses the new filters)
+        """
+        request_queue = self.request_queue
+        if request_queue is None:
+            return False
+        for request in self.request_iterator():
+            request_queue.put(request)
+        return True
+
     def valid_response(self, response) -> bool:
         if hasattr(response, 'slot') and response.slot:
             return True
@@ -154,10 +264,11 @@ class gRPCCLient:
             # Start health check in background
             health_task = asyncio.create_task(check_connection_health())
             
-            responses = self.stub.Subscribe(self.request_iterator(from_slot))
+            responses = self.stub.Subscribe(self._request_stream(from_slot))
             
             for response in responses:
                 monitor.update()  # Update last response time
+                self._handle_ping(response)
                 if self.valid_response(response):
                     yield response
                     
@@ -182,10 +293,146 @@ class gRPCCLient:
                 except asyncio.CancelledError:
                     pass
             
+            self.close_request_stream()
+
             # Close channel
             if self.channel:
                 self.channel.close()
 
+    def _read_stream(self, loop: asyncio.AbstractEventLoop, on_update, monitor: ConnectionMonitor, stopped: threading.Event,
+                     from_slot=None):
+        """Reads the blocking stream on a worker thread, passing valid updates to on_update on the event loop."""
+        if stopped.is_set():
+            return
+        self.call = self.stub.Subscribe(self._request_stream(from_slot))
+        if stopped.is_set():
+            self.call.cancel()  # Stopped while the call was being started, cancel_stream may have missed it
+        try:
+            for response in self.call:
+                monitor.update()
+                self._handle_ping(response)
+                if self.valid_response(response):
+                    loop.call_soon_threadsafe(on_update, response)
+        finally:
+            self.close_request_stream()
+
+    @staticmethod
+    async def _run_in_thread(func, *args):
+        """
+        Runs a blocking func on its own daemon thread and waits for it. Streams can run for hours, so they don't take
+        a thread from the default executor where they would starve other to_thread calls (and each other).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def settle(result, error):
+            if future.done():
+                return  # The waiting task was cancelled
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def target():
+            result, error = None, None
+            try:
+                result = func(*args)
+            except BaseException as e:
+                error = e
+            try:
+                loop.call_soon_threadsafe(settle, result, error)
+            except RuntimeError:
+                pass  # Event loop already closed
+
+        threading.Thread(target=target, name=f"{func.__qualname__}", daemon=True).start()
+        return await future
+
+    async def _watch_connection(self, monitor: ConnectionMonitor):
+        """Cancels the call if no data has arrived within connection_timeout, which makes run_with_callback reconnect."""
+        while True:
+            await asyncio.sleep(5)
+            if monitor.check_timeout():
+                logger.warning(f"Connection timeout detected - no data for {self.connection_timeout} seconds")
+                self.cancel_stream()
+
+    def cancel_stream(self):
+        """Cancels the active Subscribe call, the channel is left open."""
+        if self.call is not None:
+            self.call.cancel()
+
+    async def run_with_callback(self, on_update, reconnect_delay: float = 5, from_slot=None, on_reconnect=None):
+        """
+        Keeps a subscription running until cancelled, reconnecting on errors and timeouts.
+        Unlike start_monitoring the stream is read on its own thread so waiting for updates doesn't block the event
+        loop, each valid update is passed to on_update on the event loop.
+
+        on_reconnect is called before each reconnect, so callers can catch up on updates missed while disconnected.
+        Filter changes don't need a reconnect, see update_filters.
+        """
+        loop = asyncio.get_running_loop()
+        reconnecting = False
+        while True:
+            if reconnecting and on_reconnect is not None:
+                on_reconnect()
+            monitor = ConnectionMonitor(self.connection_timeout)
+            stopped = threading.Event()
+            watchdog = asyncio.create_task(self._watch_connection(monitor))
+            try:
+                await self._run_in_thread(self._read_stream, loop, on_update, monitor, stopped, from_slot)
+            except Exception as e:
+                if isinstance(e, grpc.RpcError):
+                    logger.error(f"gRPC error occurred: {e.code()} - {e.details()}")
+                else:
+                    logger.error(f"Unexpected error in run_with_callback: {type(e).__name__} - {e}")
+            finally:
+                watchdog.cancel()
+                stopped.set()
+                self.cancel_stream()  # Stops the reading thread if this task was cancelled
+
+            await asyncio.sleep(reconnect_delay)
+            self._connect()
+            reconnecting = True
+
+    def get_latest_blockhash(self, commitment=geyser_pb2.CommitmentLevel.FINALIZED, timeout: float = 5) -> geyser_pb2.GetLatestBlockhashResponse:
+        """
+        Unary GetLatestBlockhash call.
+
+        Raises:
+            grpc.RpcError: If the call fails
+        """
+        request = geyser_pb2.GetLatestBlockhashRequest(commitment=commitment)
+        return self.stub.GetLatestBlockhash(request, timeout=timeout)
+
+    def get_block_height(self, commitment=geyser_pb2.CommitmentLevel.FINALIZED, timeout: float = 5) -> int:
+        """
+        Unary GetBlockHeight call.
+
+        Raises:
+            grpc.RpcError: If the call fails
+        """
+        request = geyser_pb2.GetBlockHeightRequest(commitment=commitment)
+        return self.stub.GetBlockHeight(request, timeout=timeout).block_height
+
+    def get_slot(self, commitment=geyser_pb2.CommitmentLevel.FINALIZED, timeout: float = 5) -> int:
+        """
+        Unary GetSlot call.
+
+        Raises:
+            grpc.RpcError: If the call fails
+        """
+        request = geyser_pb2.GetSlotRequest(commitment=commitment)
+        return self.stub.GetSlot(request, timeout=timeout).slot
+
+    def is_blockhash_valid(self, blockhash: str, commitment=geyser_pb2.CommitmentLevel.FINALIZED, timeout: float = 5) -> bool:
+        """
+        Unary IsBlockhashValid call.
+
+        Raises:
+            grpc.RpcError: If the call fails
+        """
+        request = geyser_pb2.IsBlockhashValidRequest(blockhash=blockhash, commitment=commitment)
+        return self.stub.IsBlockhashValid(request, timeout=timeout).valid
+
     def close(self):
         """Close the gRPC channel"""
         if self.channel:
@@ -1,4 +1,5 @@
 from .RPCResponses import *
+from .SignatureList import SignatureList
 
 class RPC_Error(Exception):
     def __init__(self, msg):
@@ -6,6 +7,8 @@ class RPC_Error(Exception):
 
 
 class RPCRequest:
+    priority = None  # Priority lane to send in by default, None uses the endpoint's default lane
+
     def __init__(self, method, params):
         self.method = method
         self.params = params
@@ -33,7 +36,8 @@ class getTransactionRequest(RPCRequest):
             return None
 
 class getSignaturesForAddressRequest(RPCRequest):
-    def __init__(self, address, limit=None, before=None, until=None, encoding="jsonParsed", commitment='finalized', max_supported_transaction_version=0):
+    def __init__(self, address, limit=None, before=None, until=None, encoding="jsonParsed", commitment='finalized', max_supported_transaction_version=0, compact=False):
+        self.compact = compact  # Parse into a SignatureList instead of a list of RPCSignature
         params = [
             address,
             {
@@ -49,10 +53,44 @@ class getSignaturesForAddressRequest(RPCRequest):
 
     def parse_response(self, response):
         if 'result' in response and response['result'] is not None:  # Checking if not none as if it's empty list boolean check won't work
+            if self.compact:
+                return SignatureList.from_json(response['result'])
             return [RPCSignature(signature) for signature in response['result']]
         else:
             return None
 
+class getSignatureStatusesRequest(RPCRequest):
+    def __init__(self, signatures, search_transaction_history=False):
+        """
+        Initialize the getSignatureStatuses request.
+
+        :param signatures: List of transaction signatures to look up (max 256 per request)
+        :param search_transaction_history: If True, also search the ledger for signatures not in the recent status cache
+        """
+        self.signatures = list(signatures)
+        params = [
+            self.signatures,
+            {"searchTransactionHistory": search_transaction_history}
+        ]
+        super().__init__("getSignatureStatuses", params)
+
+    def parse_response(self, response):
+        """
+        Parse the response of the getSignatureStatuses request.
+
+        :param response: The raw JSON response from the Solana RPC
+        :return: List of RPCSignatureStatus (None for unknown signatures) in the same order as signatures,
+                 or None if no result
+        """
+        if 'result' in response and response['result'] is not None:
+            values = response['result'].get('value') or []
+            return [
+                RPCSignatureStatus(signature, status) if status else None
+                for signature, status in zip(self.signatures, values)
+            ]
+        else:
+            return None
+
 class getBlockRequest(RPCRequest):
     def __init__(self, block, encoding="json", commitment="finalized", transaction_details="full", rewards=False):
         params = [
@@ -73,6 +111,64 @@ class getBlockRequest(RPCRequest):
             return None
 
 
+class getBlocksRequest(RPCRequest):
+    def __init__(self, start_slot, end_slot=None, commitment="finalized"):
+        """
+        Initialize the getBlocks request, lists the confirmed (non skipped) slots between start_slot and end_slot.
+
+        :param start_slot: First slot of the range (inclusive)
+        :param end_slot: Last slot of the range (inclusive), must be no more than 500,000 slots higher than start_slot
+        :param commitment: The commitment level, "confirmed" or "finalized"
+        """
+        params = [start_slot]
+        if end_slot is not None:
+            params.append(end_slot)
+        params.append({"commitment": commitment})
+        super().__init__("getBlocks", params)
+
+    def parse_response(self, response):
+        if 'result' in response and response['result'] is not None:  # Checking if not none as if it's empty list boolean check won't work
+            return response['result']  # Returns list of ints
+        else:
+            return None
+
+
+class getBlocksWithLimitRequest(RPCRequest):
+    def __init__(self, start_slot, limit, commitment="finalized"):
+        """
+        Initialize the getBlocksWithLimit request, lists up to limit confirmed (non skipped) slots starting at start_slot.
+
+        :param start_slot: First slot to search from (inclusive)
+        :param limit: Maximum number of slots to return, must be no more than 500,000
+        :param commitment: The commitment level, "confirmed" or "finalized"
+        """
+        params = [start_slot, limit, {"commitment": commitment}]
+        super().__init__("getBlocksWithLimit", params)
+
+    def parse_response(self, response):
+        if 'result' in response and response['result'] is not None:
+            return response['result']  # Returns list of ints
+        else:
+            return None
+
+
+class getBlockTimeRequest(RPCRequest):
+    def __init__(self, slot):
+        """
+        Initialize the getBlockTime request.
+
+        :param slot: Slot of the block, skipped slots return an error
+        """
+        params = [slot]
+        super().__init__("getBlockTime", params)
+
+    def parse_response(self, response):
+        if 'result' in response and response['result'] is not None:
+            return response['result']  # Returns int, unix timestamp
+        else:
+            return None
+
+
 class getBlockHeightRequest(RPCRequest):
     def __init__(self, commitment="finalized"):
         params = [
@@ -113,8 +209,56 @@ class getProgramAccountsRequest(RPCRequest):
             return None
 
 
+class getMultipleAccountsRequest(RPCRequest):
+    def __init__(self, pubkeys, encoding="base64", commitment="finalized", data_slice=None):
+        """
+        Initialize the getMultipleAccounts request.
+
+        :param pubkeys: List of account public keys to query (max 100 per request)
+        :param encoding: The encoding for the account data (default is "base64")
+        :param commitment: The commitment level (default is "finalized")
+        :param data_slice: Optional dict with 'offset' and 'length' to return a subset of the account data
+        """
+        self.pubkeys = list(pubkeys)
+        self.encoding = encoding
+        params = [
+            self.pubkeys,
+            {
+                "encoding": encoding,
+                "commitment": commitment
+            }
+        ]
+        if data_slice:
+            if encoding in ["base58", "base64", "base64+zstd"]:
+                params[1]["dataSlice"] = data_slice
+            else:
+                print(f"To use dataSlice please use a valid encoding, instead creating request without dataSlice")
+
+        super().__init__("getMultipleAccounts", params)
+
+    def parse_response(self, response):
+        """
+        Parse the response of the getMultipleAccounts request.
+
+        :param response: The raw JSON response from the Solana RPC
+        :return: List of RPCProgramAccount (None for accounts that don't exist) in the same order as pubkeys,
+                 or None if no result
+        """
+        if 'result' in response and response['result'] is not None:
+            values = response['result'].get('value') or []
+            slot = response['result'].get('context', {}).get('slot')
+            return [
+                RPCProgramAccount({'pubkey': pubkey, 'account': value}, self.encoding, slot) if value else None
+                for pubkey, value in zip(self.pubkeys, values)
+            ]
+        else:
+            return None
+
+
 class sendTransactionRequest(RPCRequest):
-    def __init__(self, tx, encoding="base64", skip_preflight=False, preflight_commitment="finalized"):
+    priority = "critical"
+
+    def __init__(self, tx, encoding="base64", skip_preflight=False, preflight_commitment="finalized", max_retries=None):
         """
         Initialize the sendTransactionRequest object with the transaction to send.
         
@@ -122,6 +266,7 @@ class sendTransactionRequest(RPCRequest):
         :param encoding: The encoding for the transaction (default is "base64")
         :param skip_preflight: If True, skip the preflight transaction checks
         :param preflight_commitment: The commitment level for preflight (default is "finalized")
+        :param max_retries: How many times the node retries sending to the leader, None leaves it to the node
         """
         params = [
             tx,
@@ -131,6 +276,8 @@ class sendTransactionRequest(RPCRequest):
                 "preflightCommitment": preflight_commitment
             }
         ]
+        if max_retries is not None:
+            params[1]["maxRetries"] = max_retries
         super().__init__("sendTransaction", params)
 
     def parse_response(self, response):
@@ -211,4 +358,31 @@ class getSlotRequest(RPCRequest):
         if 'result' in response and response['result'] is not None:
             return response['result']  # Returns int
         else:
-            return None
\ No newline at end of file
+            return None
+
+
+class getLatestBlockhashRequest(RPCRequest):
+    priority = "critical"  # Needed to build transactions
+
+    def __init__(self, commitment="finalized"):
+        """
+        Initialize the getLatestBlockhash request.
+
+        :param commitment: The commitment level (default is "finalized")
+        """
+        params = [
+            {"commitment": commitment}
+        ]
+        super().__init__("getLatestBlockhash", params)
+
+    def parse_response(self, response):
+        """
+        Parse the response of the getLatestBlockhash request.
+
+        :param response: The raw JSON response from the Solana RPC
+        :return: RPCLatestBlockhash object or None if no result
+        """
+        if 'result' in response and response['result'] is not None:
+            return RPCLatestBlockhash(response['result'])
+        else:
+            return None
@@ -1,4 +1,5 @@
 from argus_rpc.utils.RPC import decoders
+from argus_rpc.utils.RPC.compiled_structs import parse_layout
 
 class RPCTransaction:
     def __init__(self, response):
@@ -54,6 +55,31 @@ class RPCSignature:
         self.memo = signature_data.get('memo', None)
         self.block_time = signature_data.get('blockTime', None)
 
+class RPCSignatureStatus:
+    COMMITMENT_LEVELS = ["processed", "confirmed", "finalized"]  # In order of increasing confirmation
+
+    def __init__(self, signature, status_data):
+        """
+        Initializes the RPCSignatureStatus object with a single entry from the getSignatureStatuses response.
+
+        :param signature: The signature the status is for
+        :param status_data: The status JSON for the signature
+        """
+        self.signature = signature
+        self.slot = status_data.get('slot', None)
+        self.confirmations = status_data.get('confirmations', None)  # None once the transaction is rooted
+        self.err = status_data.get('err', None)
+        self.confirmation_status = status_data.get('confirmationStatus', None)
+
+    def has_reached(self, commitment):
+        """True if the transaction has reached the given commitment level (or a higher one)."""
+        if self.confirmation_status not in self.COMMITMENT_LEVELS:
+            return self.confirmations is None  # Older nodes only report confirmations, None means rooted
+        return self.COMMITMENT_LEVELS.index(self.confirmation_status) >= self.COMMITMENT_LEVELS.index(commitment)
+
+    def __str__(self):
+        return f"Signature Status: {self.signature}, Slot: {self.slot}, Status: {self.confirmation_status}"
+
 class RPCBlock:
     def __init__(self, block_data):
         """
@@ -84,14 +110,16 @@ class RPCBlock:
 
 
 class RPCProgramAccount:
-    def __init__(self, account_data, encoding):
+    def __init__(self, account_data, encoding, slot=None):
         """
         Initializes the RPCProgramAccount object with the raw response from the Solana JSON-RPC getProgramAccounts method.
         
         :param account_data: A single account entry from the getProgramAccounts response
         :param encoding: Encoding used for request (Needed to decode data)
+        :param slot: Context slot of the response, if known
         """
         self.encoding = encoding
+        self.slot = slot
         self.pubkey = account_data.get('pubkey', None)
         self.account = account_data.get('account', {})
         self.lamports = self.account.get('lamports', None)
@@ -101,9 +129,15 @@ class RPCProgramAccount:
         self.data = self.account.get('data', None)
         self.decoded_data = None
     
+    def raw_data(self) -> bytes:
+        """Account data as bytes."""
+        data = self.data
+        if isinstance(data, list):  # Binary encodings are returned as [data, encoding]
+            data = data[0]
+        return decoders.decode_on_type(data, self.encoding)
+
     def decode_data(self, account_layout_struct):
-        data = decoders.decode_on_type(self.data, self.encoding)
-        self.decoded_data = account_layout_struct.parse(data)
+        self.decoded_data = parse_layout(account_layout_struct, self.raw_data())
 
     def __str__(self):
         return f"Program Account: {self.pubkey}"
@@ -179,7 +213,7 @@ class RPCAccountInfo:
         if self.data and self.encoding:
             # Use the actual encoding provided in the response
             data_bytes = decoders.decode_on_type(self.data, self.encoding)
-            self.decoded_data = account_layout_struct.parse(data_bytes)
+            self.decoded_data = parse_layout(account_layout_struct, data_bytes)
 
     def __str__(self):
         if not self.exists:
@@ -198,3 +232,19 @@ class RPCAccountInfo:
             and self.space == other.space
             and self.data == other.data
         )
+
+
+class RPCLatestBlockhash:
+    def __init__(self, result_data):
+        """
+        Initializes the RPCLatestBlockhash object with the 'result' field from the getLatestBlockhash response.
+
+        :param result_data: The 'result' field from the getLatestBlockhash response
+        """
+        self.slot = result_data.get('context', {}).get('slot')
+        value = result_data.get('value', {})
+        self.blockhash = value.get('blockhash')
+        self.last_valid_block_height = value.get('lastValidBlockHeight')
+
+    def __str__(self):
+        return f"Blockhash: {self.blockhash}, Last valid block height: {self.last_valid_block_height}"
@@ -0,0 +1,124 @@
+import base58
+import numpy as np
+from typing import List, Iterator
+
+
+class SignatureList:
+    """
+    Compact list of signatures stored as parallel arrays instead of an RPCSignature object per signature.
+
+    slots: int64 array
+    block_times: int64 array, -1 where the block time is unknown
+    signature_buffer: uint8 array of shape (n, 64), the raw signature bytes
+    error_bitmap: bits packed uint8 array, bit i set if signature i failed
+
+    Signatures are only base58 encoded when accessed. Lists are kept in order from oldest to newest.
+    """
+    SIGNATURE_SIZE = 64
+
+    def __init__(self, slots=None, block_times=None, signature_buffer=None, error_bitmap=None):
+        self.slots = np.asarray(slots if slots is not None else [], dtype=np.int64)
+        self.block_times = np.asarray(block_times if block_times is not None else [], dtype=np.int64)
+        self.signature_buffer = np.asarray(
+            signature_buffer if signature_buffer is not None else np.empty((0, self.SIGNATURE_SIZE)), dtype=np.uint8
+        ).reshape(-1, self.SIGNATURE_SIZE)
+        self.error_bitmap = np.asarray(error_bitmap if error_bitmap is not None else [], dtype=np.uint8)
+
+    @classmethod
+    def from_json(cls, signatures_json: List[dict]) -> "SignatureList":
+        """
+        Builds a list from the 'result' of a getSignaturesForAddress response, which is ordered newest to oldest.
+        """
+        signatures_json = signatures_json[::-1]  # Oldest first
+        n = len(signatures_json)
+        slots = np.fromiter((sig['slot'] for sig in signatures_json), dtype=np.int64, count=n)
+        block_times = np.fromiter(
+            (sig['blockTime'] if sig.get('blockTime') is not None else -1 for sig in signatures_json), dtype=np.int64, count=n
+        )
+        signature_buffer = np.frombuffer(
+            b"".join(base58.b58decode(sig['signature']).rjust(cls.SIGNATURE_SIZE, b"\0") for sig in signatures_json),
+            dtype=np.uint8
+        )
+        errors = np.fromiter((sig.get('err') is not None for sig in signatures_json), dtype=bool, count=n)
+
+        signature_list = cls(slots, block_times, signature_buffer, np.packbits(errors))
+        # Pages are already ordered but sort (stable, so same slot order is kept) in case a provider doesn't
+        return signature_list.sort()
+
+    @property
+    def errors(self) -> np.ndarray:
+        """Bool array, True where the transaction failed."""
+        return np.unpackbits(self.error_bitmap, count=len(self)).astype(bool)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        return base58.b58encode(self.signature_buffer[index].tobytes()).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_list(self) -> List[str]:
+        """Base58 encodes every signature."""
+        return list(self)
+
+    def take(self, indices) -> "SignatureList":
+        """New list with only the signatures at indices (int array or bool mask)."""
+        return SignatureList(
+            self.slots[indices],
+            self.block_times[indices],
+            self.signature_buffer[indices],
+            np.packbits(self.errors[indices]),
+        )
+
+    def sort(self) -> "SignatureList":
+        """Sorts by slot, oldest first. Stable so signatures in the same slot keep their order."""
+        order = np.argsort(self.slots, kind='stable')
+        return self.take(order)
+
+    def filter(self, min_slot=None, max_slot=None, min_time=None, max_time=None, exclude_errors=False,
+               keep_unknown_times=False) -> "SignatureList":
+        """
+        Vectorized filtering, bounds are inclusive. Signatures with unknown block times are removed by a time filter
+        unless keep_unknown_times is set.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        unknown_times = self.block_times < 0
+        if min_slot is not None:
+            mask &= self.slots >= min_slot
+        if max_slot is not None:
+            mask &= self.slots <= max_slot
+        if min_time is not None:
+            mask &= (self.block_times >= min_time) | (unknown_times & keep_unknown_times)
+        if max_time is not None:
+            mask &= ((self.block_times <= max_time) & ~unknown_times) | (unknown_times & keep_unknown_times)
+        if exclude_errors:
+            mask &= ~self.errors
+        return self.take(mask)
+
+    @classmethod
+    def merge(cls, signature_lists: List["SignatureList"]) -> "SignatureList":
+        """
+        Merges already sorted lists into one sorted list. Lists that don't overlap (e.g. consecutive pages) are just
+        concatenated in slot order, otherwise a stable sort is used which merges the sorted runs.
+        """
+        signature_lists = [signature_list for signature_list in signature_lists if len(signature_list)]
+        if not signature_lists:
+            return cls()
+
+        signature_lists.sort(key=lambda signature_list: signature_list.slots[0])
+        merged = cls(
+            np.concatenate([signature_list.slots for signature_list in signature_lists]),
+            np.concatenate([signature_list.block_times for signature_list in signature_lists]),
+            np.concatenate([signature_list.signature_buffer for signature_list in signature_lists]),
+            np.packbits(np.concatenate([signature_list.errors for signature_list in signature_lists])),
+        )
+
+        overlapping = any(
+            previous.slots[-1] > current.slots[0] for previous, current in zip(signature_lists, signature_lists[1:])
+        )
+        return merged.sort() if overlapping else merged
@@ -0,0 +1,235 @@
+import struct
+import base58
+import numpy as np
+from construct import Struct, Renamed, FormatField, Bytes, Array, Container, ListContainer, StreamError
+from typing import Dict, List, Optional
+
+from .structs import PublicKey, LIQUIDITY_STATE_LAYOUT_V4, LAUNCHPAD_POOL_LAYOUT
+
+
+class CompiledContainer:
+    """
+    Lazily decoded account from CompiledLayout.parse, read like a construct Container (container.field or
+    container["field"]). Values stay as the unpacked tuple, public keys are only base58 encoded when they're accessed.
+    It isn't a dict, use to_dict() or CompiledLayout.parse_container where one is needed.
+    """
+    __slots__ = ("_layout", "_values", "_start", "_pubkeys")
+
+    def __init__(self, layout: "CompiledLayout", values: tuple, start: int = 0):
+        self._layout = layout
+        self._values = values
+        self._start = start  # Position of this (possibly nested) struct's first value in values
+        self._pubkeys = None
+
+    def __getattr__(self, name):
+        try:
+            kind, index, extra = self._layout.fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        index += self._start
+        if kind == "value":
+            return self._values[index]
+        if kind == "array":
+            return list(self._values[index: index + extra])
+        if kind == "struct":
+            return CompiledContainer(extra, self._values, index)
+        # Public key
+        if self._pubkeys is None:
+            self._pubkeys = {}
+        pubkey = self._pubkeys.get(name)
+        if pubkey is None:
+            pubkey = base58.b58encode(self._values[index]).decode('utf-8')
+            self._pubkeys[name] = pubkey
+        return pubkey
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name):
+        return name in self._layout.fields
+
+    def keys(self):
+        return list(self._layout.fields)
+
+    def items(self):
+        return [(name, getattr(self, name)) for name in self._layout.fields]
+
+    def to_dict(self) -> dict:
+        return {
+            name: value.to_dict() if isinstance(value, CompiledContainer) else value for name, value in self.items()
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, CompiledContainer) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"CompiledContainer({self.to_dict()})"
+
+
+class CompiledLayout:
+    """
+    Fixed offset decoder compiled from a construct Struct made of fixed size fields (integers, Bytes, Arrays of
+    integers, PublicKey and nested Structs of those).
+
+    parse() decodes one account with a single struct.Struct.unpack_from into a lazy CompiledContainer,
+    parse_container() does the same but returns a construct Container like Struct.parse. parse_many() decodes many
+    same size accounts from one contiguous buffer with a NumPy structured dtype in one vectorized call.
+    """
+    def __init__(self, layout: Struct):
+        """
+        :param layout: construct.Struct to compile.
+
+        :raises ValueError: If the layout contains a field that isn't fixed size or isn't supported.
+        """
+        self.layout = layout
+        self.fields: Dict[str, tuple] = {}  # Name: (kind, index of first value, array length or nested layout)
+        formats, dtype_fields, self.num_values = self._compile(layout)
+        self.struct = struct.Struct("<" + "".join(formats))
+        self.dtype = np.dtype(dtype_fields)
+        self.size = self.struct.size
+
+    @staticmethod
+    def _format_field(subcon: FormatField) -> str:
+        byte_order, code = subcon.fmtstr[0], subcon.fmtstr[1:]
+        if byte_order not in "<=" and struct.calcsize(code) > 1:
+            raise ValueError(f"Only little endian fields can be compiled, got {subcon.fmtstr}")
+        return code
+
+    def _compile(self, layout: Struct):
+        """Returns the struct format of each field, the dtype fields and the number of values unpack_from returns."""
+        formats = []
+        dtype_fields = []
+        index = 0
+        for subcon in layout.subcons:
+            if not isinstance(subcon, Renamed) or not subcon.name:
+                raise ValueError(f"Unnamed field {subcon} can't be compiled")
+            name, subcon = subcon.name, subcon.subcon
+
+            if isinstance(subcon, PublicKey):
+                formats.append("32s")
+                dtype_fields.append((name, "u1", (32,)))
+                self.fields[name] = ("pubkey", index, None)
+                index += 1
+            elif isinstance(subcon, FormatField):
+                code = self._format_field(subcon)
+                formats.append(code)
+                dtype_fields.append((name, np.dtype("<" + code)))
+                self.fields[name] = ("value", index, None)
+                index += 1
+            elif isinstance(subcon, Bytes) and isinstance(subcon.length, int):
+                formats.append(f"{subcon.length}s")
+                dtype_fields.append((name, "u1", (subcon.length,)))
+                self.fields[name] = ("value", index, None)
+                index += 1
+            elif isinstance(subcon, Array) and isinstance(subcon.count, int) and isinstance(subcon.subcon, FormatField):
+                code = self._format_field(subcon.subcon)
+                formats.append(f"{subcon.count}{code}")
+                dtype_fields.append((name, np.dtype("<" + code), (subcon.count,)))
+                self.fields[name] = ("array", index, subcon.count)
+                index += subcon.count
+            elif isinstance(subcon, Struct):
+                nested = CompiledLayout(subcon)
+                formats.append(nested.struct.format[1:])
+                dtype_fields.append((name, nested.dtype))
+                self.fields[name] = ("struct", index, nested)
+                index += nested.num_values
+            else:
+                raise ValueError(f"Field {name} of type {type(subcon).__name__} can't be compiled")
+        return formats, dtype_fields, index
+
+    def _unpack(self, data: bytes) -> tuple:
+        try:
+            return self.struct.unpack_from(data)
+        except struct.error as e:
+            # Same error construct raises for short data, so callers catching construct errors keep working
+            raise StreamError(f"Unable to decode {len(data)} bytes with a {self.size} byte layout: {e}") from e
+
+    def parse(self, data: bytes) -> CompiledContainer:
+        """
+        Decodes one account, extra bytes after the layout are ignored like construct does.
+
+        :raises StreamError: If data is shorter than the layout.
+        """
+        return CompiledContainer(self, self._unpack(data))
+
+    def parse_container(self, data: bytes) -> Container:
+        """
+        Decodes one account into a construct Container with the same values Struct.parse gives.
+
+        :raises StreamError: If data is shorter than the layout.
+        """
+        return self._to_container(self._unpack(data), 0)
+
+    def _to_container(self, values: tuple, start: int) -> Container:
+        container = Container()
+        for name, (kind, index, extra) in self.fields.items():
+            index += start
+            if kind == "value":
+                container[name] = values[index]
+            elif kind == "array":
+                container[name] = ListContainer(values[index: index + extra])
+            elif kind == "struct":
+                container[name] = extra._to_container(values, index)
+            else:
+                container[name] = base58.b58encode(values[index]).decode('utf-8')
+        return container
+
+    def parse_many(self, data, item_size: int = None) -> np.ndarray:
+        """
+        Decodes many accounts at once.
+
+        :param data: Contiguous buffer of accounts back to back, or a list of account data (which gets joined).
+        :param item_size: Bytes per account in data, defaults to the layout size. Set it when the accounts are
+                          bigger than the layout (e.g. padding at the end).
+
+        :return: NumPy structured array, one record per account. Public key fields are (n, 32) uint8 columns,
+                 see encode_pubkeys.
+        """
+        item_size = item_size or self.size
+        if isinstance(data, (list, tuple)):
+            data = b"".join(bytes(item[:item_size]).ljust(item_size, b"\0") for item in data)
+        dtype = self.dtype
+        if item_size != self.size:
+            dtype = np.dtype({
+                "names": dtype.names,
+                "formats": [dtype.fields[name][0] for name in dtype.names],
+                "offsets": [dtype.fields[name][1] for name in dtype.names],
+                "itemsize": item_size,
+            })
+        return np.frombuffer(data, dtype=dtype, count=len(data) // item_size)
+
+    @staticmethod
+    def encode_pubkeys(column: np.ndarray) -> List[str]:
+        """Base58 encodes a public key column from parse_many."""
+        return [base58.b58encode(row.tobytes()).decode('utf-8') for row in column]
+
+
+_compiled_layouts: Dict[int, tuple] = {}  # id(layout): (layout, compiled layout or None), the layout is kept so its id isn't reused
+
+def get_compiled_layout(layout: Struct) -> Optional[CompiledLayout]:
+    """Compiled version of layout (compiled once and cached), None if it can't be compiled."""
+    key = id(layout)
+    if key not in _compiled_layouts:
+        try:
+            _compiled_layouts[key] = (layout, CompiledLayout(layout))
+        except ValueError:
+            _compiled_layouts[key] = (layout, None)
+    return _compiled_layouts[key][1]
+
+
+def parse_layout(layout: Struct, data: bytes) -> Container:
+    """
+    Parses data into a construct Container with the compiled version of layout, or with construct if the layout
+    can't be compiled.
+    """
+    compiled = get_compiled_layout(layout)
+    if compiled is None:
+        return layout.parse(data)
+    return compiled.parse_container(data)
+
+
+LIQUIDITY_STATE_V4_DECODER = get_compiled_layout(LIQUIDITY_STATE_LAYOUT_V4)
+LAUNCHPAD_POOL_DECODER = get_compiled_layout(LAUNCHPAD_POOL_LAYOUT)
@@ -0,0 +1,64 @@
+"""
+Benchmark of AccountsChangesStream owner matching across wallet set sizes.
+
+Compares the old approach (base58 encode the owner bytes of every update and check list membership) with the raw
+32 byte key set used by AccountsChangesStream.valid_response.
+"""
+import os
+import time
+import base58
+
+from argus_rpc.generated import geyser_pb2
+from argus_rpc.AccountsChangesStream import AccountsChangesStream
+
+WALLET_SET_SIZES = [10, 1_000, 10_000, 100_000, 500_000]
+NUM_UPDATES = 20_000
+MATCH_RATIO = 0.1  # Share of updates owned by a watched wallet
+
+
+def make_updates(wallet_keys):
+    updates = []
+    for i in range(NUM_UPDATES):
+        owner = wallet_keys[i % len(wallet_keys)] if i % int(1 / MATCH_RATIO) == 0 else os.urandom(32)
+        data = os.urandom(32) + owner + os.urandom(101)
+        updates.append(geyser_pb2.SubscribeUpdate(
+            account=geyser_pb2.SubscribeUpdateAccount(account=geyser_pb2.SubscribeUpdateAccountInfo(data=data))
+        ))
+    return updates
+
+
+def old_valid_response(update, wallet_addresses):
+    account_data = update.account.account.data
+    owner_pubkey = base58.b58encode(bytes(account_data[32:64])).decode('utf-8')
+    return owner_pubkey in wallet_addresses
+
+
+def main():
+    for size in WALLET_SET_SIZES:
+        wallet_keys = [os.urandom(32) for _ in range(size)]
+        wallet_addresses = [base58.b58encode(key).decode() for key in wallet_keys]
+        updates = make_updates(wallet_keys)
+
+        # Skip __init__ so no channel is created
+        stream = AccountsChangesStream.__new__(AccountsChangesStream)
+        stream.wallet_addresses = wallet_addresses
+        stream.wallet_keys = set(wallet_keys)
+
+        start = time.perf_counter()
+        new_matches = sum(stream.valid_response(update) for update in updates)
+        new_time = time.perf_counter() - start
+
+        # List membership is too slow to run over every update at large sizes, time a sample and scale it
+        sample = updates[:max(10, min(NUM_UPDATES, 2_000_000 // size))]
+        start = time.perf_counter()
+        old_matches = sum(old_valid_response(update, wallet_addresses) for update in sample)
+        old_time = (time.perf_counter() - start) * NUM_UPDATES / len(sample)
+
+        print(
+            f"{size:>8} wallets: raw key set {new_time / NUM_UPDATES * 1e9:8.0f} ns/update ({new_matches} matches), "
+            f"base58 + list {old_time / NUM_UPDATES * 1e9:10.0f} ns/update ({old_matches} matches in {len(sample)} sampled)"
+        )
+
+
+if __name__ == "__main__":
+    main()